@@ -6,7 +6,7 @@ Serves the React frontend and provides real-time event streaming via WebSocket.
 Reuses existing MetricsCollector and StackAnalyzer logic.
 
 Usage:
-    python dashboard-server.py <project_dir> [--port 3847] [--no-open]
+    python dashboard-server.py <project_dir> [--port 3847] [--no-open] [--runtime react|preact]
 
 Features:
     - HTTP server for static frontend and REST API
@@ -16,15 +16,18 @@ Features:
 """
 
 import argparse
+import hashlib
 import json
+import shutil
 import signal
+import subprocess
 import sys
 import threading
 import webbrowser
 from datetime import datetime
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import parse_qs, urlparse
 
 # Import existing analysis modules
@@ -214,20 +217,32 @@ class DashboardAPI:
         }
 
     def get_stack(self, session_id: Optional[str] = None) -> Dict[str, Any]:
-        """Get stack analysis."""
+        """Get stack analysis. hooks.hooks lists only the hook events that fired."""
         metrics = self._get_metrics(session_id)
         stack = self._get_stack()
         stack_summary = stack.get_stack_summary(metrics.events)
+        hooks = stack_summary["hooks"]
 
         return {
             "rules": stack_summary["rules"],
-            "hooks": stack_summary["hooks"],
+            "hooks": {**hooks, "hooks": [h for h in hooks["hooks"] if h["fired"] > 0]},
             "skills": stack_summary["skills"],
             "agents": stack_summary["agents"],
             "total_tokens": stack_summary["total_tokens"],
             "total_components": stack_summary["total_components"]
         }
 
+    def get_dashboard(self, pages: List[str], session_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get several page payloads in one response, keyed by page name."""
+        handlers = {
+            "overview": self.get_overview,
+            "tools": self.get_tools,
+            "timeline": self.get_timeline,
+            "alerts": self.get_alerts,
+            "stack": self.get_stack
+        }
+        return {page: handlers[page](session_id) for page in pages if page in handlers}
+
     def get_events_since(self, session_id: Optional[str], last_event_id: Optional[str] = None) -> List[Dict]:
         """Get new events since last_event_id for real-time streaming."""
         metrics = self._get_metrics(session_id)
@@ -298,6 +313,9 @@ class DashboardHTTPHandler(SimpleHTTPRequestHandler):
                 data = self.api.get_alerts(session_id)
             elif path == "/api/stack":
                 data = self.api.get_stack(session_id)
+            elif path == "/api/dashboard":
+                pages = query.get("pages", [""])[0].split(",")
+                data = self.api.get_dashboard(pages, session_id)
             elif path == "/api/events":
                 last_id = query.get("since", [None])[0]
                 data = {"events": self.api.get_events_since(session_id, last_id)}
@@ -310,12 +328,43 @@ class DashboardHTTPHandler(SimpleHTTPRequestHandler):
         except Exception as e:
             self._send_error(500, str(e))
 
+    @staticmethod
+    def _split_timestamp(data: Any) -> Tuple[Any, Optional[str]]:
+        """Separate the per-request overview timestamp from a payload.
+
+        The timestamp changes on every request, so it is sent as a header
+        instead; the body then only changes when the metrics do.
+        """
+        if isinstance(data, dict):
+            if "timestamp" in data:
+                data = dict(data)
+                return data, data.pop("timestamp")
+            overview = data.get("overview")
+            if isinstance(overview, dict) and "timestamp" in overview:
+                overview = dict(overview)
+                timestamp = overview.pop("timestamp")
+                return {**data, "overview": overview}, timestamp
+        return data, None
+
     def _send_json(self, data: Any):
-        """Send JSON response."""
+        """Send JSON response, or 304 if the client already has this payload."""
+        data, generated_at = self._split_timestamp(data)
         content = json.dumps(data, default=str).encode("utf-8")
+        etag = f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            return
+
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", len(content))
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("ETag", etag)
+        if generated_at is not None:
+            self.send_header("X-Generated-At", str(generated_at))
         self.send_header("Access-Control-Allow-Origin", "*")
         self.end_headers()
         self.wfile.write(content)
@@ -404,21 +453,12 @@ class TraceWatcher:
 # EMBEDDED FRONTEND
 # =============================================================================
 
-def get_embedded_frontend() -> str:
-    """Return the embedded React frontend as a single HTML file."""
-    return '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ctx-monitor Dashboard</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&family=JetBrains+Mono:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <script src="https://unpkg.com/react@18/umd/react.production.min.js" crossorigin></script>
-    <script src="https://unpkg.com/react-dom@18/umd/react-dom.production.min.js" crossorigin></script>
-    <script src="https://unpkg.com/@babel/standalone/babel.min.js"></script>
-    <style>
+def get_critical_styles() -> str:
+    """Return the styles needed for first paint (layout, cards, metrics).
+
+    These are inlined in the page head; everything else is deferred.
+    """
+    return '''
         :root {
             /* Design System v2.0 - Clean SaaS Dashboard */
 
@@ -558,6 +598,11 @@ def get_embedded_frontend() -> str:
             font-family: var(--font-mono);
         }
 
+        /* Fixed-width digits so refreshed numbers don't shift layout */
+        .metric-value, .table td, .rate-badge {
+            font-variant-numeric: tabular-nums;
+        }
+
         #root {
             min-height: 100vh;
         }
@@ -823,6 +868,10 @@ def get_embedded_frontend() -> str:
             overflow: hidden;
             box-shadow: var(--shadow-sm);
             transition: var(--transition-fast);
+            /* Updates inside a card don't reflow siblings; offscreen cards skip rendering */
+            contain: layout style paint;
+            content-visibility: auto;
+            contain-intrinsic-size: auto 200px;
         }
 
         .card:hover {
@@ -990,6 +1039,66 @@ def get_embedded_frontend() -> str:
             color: #F87171;
         }
 
+        /* Loading */
+        .loading {
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            padding: 40px;
+            color: var(--text-secondary);
+        }
+
+        .spinner {
+            width: 24px;
+            height: 24px;
+            border: 2px solid var(--border-color);
+            border-top-color: var(--accent-primary);
+            border-radius: 50%;
+            animation: spin 0.8s linear infinite;
+            margin-right: 12px;
+        }
+
+        @keyframes spin {
+            to { transform: rotate(360deg); }
+        }
+
+        /* Empty State */
+        .empty-state {
+            text-align: center;
+            padding: 60px 20px;
+            color: var(--text-secondary);
+        }
+
+        .empty-state-icon {
+            font-size: 48px;
+            margin-bottom: 16px;
+            opacity: 0.5;
+        }
+
+        .empty-state-title {
+            font-size: 16px;
+            font-weight: 600;
+            color: var(--text-primary);
+            margin-bottom: 8px;
+        }
+
+        /* Footer */
+        .footer {
+            padding: 16px 24px;
+            text-align: center;
+            color: var(--text-muted);
+            font-size: 11px;
+            border-top: 1px solid var(--border-color);
+        }
+'''
+
+
+def get_deferred_styles() -> str:
+    """Return the styles for charts, tables, event stream and alerts.
+
+    Served as /dashboard.css and loaded without blocking first paint.
+    """
+    return '''
         /* Sparkline - Enhanced */
         .sparkline {
             display: flex;
@@ -1024,10 +1133,13 @@ def get_embedded_frontend() -> str:
         }
 
         .progress-fill {
+            width: 100%;
             height: 100%;
             background: var(--color-primary);
             border-radius: 5px;
-            transition: width 0.5s cubic-bezier(0.4, 0, 0.2, 1);
+            transform-origin: left;
+            transform: scaleX(var(--p, 0));
+            transition: transform 0.5s cubic-bezier(0.4, 0, 0.2, 1);
             position: relative;
         }
 
@@ -1136,6 +1248,49 @@ def get_embedded_frontend() -> str:
             border-bottom: none;
         }
 
+        /* Virtualized rows are absolutely placed and moved with transforms */
+        .virtual-row {
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
+        }
+
+        .event-item.virtual-row {
+            flex-wrap: nowrap;
+            overflow: hidden;
+        }
+
+        .virtual-row > .alert-item:last-child {
+            border-bottom: 1px solid var(--border-color);
+        }
+
+        .stack-row {
+            display: flex;
+            align-items: center;
+            gap: 8px;
+            border-bottom: 1px solid var(--border-color);
+            overflow: hidden;
+            white-space: nowrap;
+        }
+
+        .stack-row-name {
+            font-weight: 500;
+            overflow: hidden;
+            text-overflow: ellipsis;
+        }
+
+        .stack-row-detail {
+            color: var(--text-muted);
+            margin-left: auto;
+            font-size: 11px;
+        }
+
+        .virtual-row .event-time {
+            flex-basis: auto;
+            margin-bottom: 0;
+        }
+
         .event-time {
             color: var(--text-muted);
             font-variant-numeric: tabular-nums;
@@ -1207,6 +1362,13 @@ def get_embedded_frontend() -> str:
             padding: clamp(12px, 2vw, 18px);
             border-bottom: 1px solid var(--border-color);
             transition: background 0.15s ease;
+            /* Offscreen alerts skip layout and paint in medium-sized, non-virtualized lists */
+            content-visibility: auto;
+            contain-intrinsic-size: auto 80px;
+        }
+
+        .alert-item.expanded {
+            contain-intrinsic-size: auto 400px;
         }
 
         .alert-item:hover {
@@ -1351,6 +1513,8 @@ def get_embedded_frontend() -> str:
             font-size: 12px;
             font-family: var(--font-mono);
             border-bottom: 1px solid var(--border-color);
+            content-visibility: auto;
+            contain-intrinsic-size: auto 32px;
         }
 
         .alert-event:last-child {
@@ -1456,61 +1620,44 @@ def get_embedded_frontend() -> str:
             color: var(--text-secondary);
         }
 
-        /* Loading */
-        .loading {
+        /* Bar Chart - Enhanced */
+        /* Sizing is resolved once on the chart and shared by every row */
+        .bar-chart {
+            --bar-gap: 14px;
+            --bar-height: 24px;
+            --bar-label-width: 90px;
+            --bar-value-width: 55px;
+            --bar-font-size: 13px;
             display: flex;
-            align-items: center;
-            justify-content: center;
-            padding: 40px;
-            color: var(--text-secondary);
-        }
-
-        .spinner {
-            width: 24px;
-            height: 24px;
-            border: 2px solid var(--border-color);
-            border-top-color: var(--accent-primary);
-            border-radius: 50%;
-            animation: spin 0.8s linear infinite;
-            margin-right: 12px;
-        }
-
-        @keyframes spin {
-            to { transform: rotate(360deg); }
-        }
-
-        /* Empty State */
-        .empty-state {
-            text-align: center;
-            padding: 60px 20px;
-            color: var(--text-secondary);
-        }
-
-        .empty-state-icon {
-            font-size: 48px;
-            margin-bottom: 16px;
-            opacity: 0.5;
+            flex-direction: column;
+            gap: var(--bar-gap);
         }
 
-        .empty-state-title {
-            font-size: 16px;
-            font-weight: 600;
-            color: var(--text-primary);
-            margin-bottom: 8px;
+        @media (max-width: 900px) {
+            .bar-chart {
+                --bar-gap: 10px;
+                --bar-height: 18px;
+                --bar-label-width: 60px;
+                --bar-value-width: 40px;
+                --bar-font-size: 11px;
+            }
         }
 
-        /* Bar Chart - Enhanced */
-        .bar-chart {
-            display: flex;
-            flex-direction: column;
-            gap: clamp(10px, 2vw, 14px);
+        @media (max-width: 600px) {
+            .bar-chart {
+                --bar-label-width: 50px;
+                --bar-value-width: 35px;
+            }
         }
 
         .bar-row {
             display: flex;
             align-items: center;
-            gap: clamp(8px, 2vw, 14px);
+            gap: var(--bar-gap);
             transition: transform 0.15s ease;
+            /* Each row is its own layout/paint root so hover shifts stay local */
+            will-change: transform;
+            contain: layout paint;
         }
 
         .bar-row:hover {
@@ -1518,9 +1665,9 @@ def get_embedded_frontend() -> str:
         }
 
         .bar-label {
-            width: clamp(60px, 12vw, 90px);
+            width: var(--bar-label-width);
             font-weight: 600;
-            font-size: clamp(11px, 1.8vw, 13px);
+            font-size: var(--bar-font-size);
             color: var(--text-primary);
             white-space: nowrap;
             overflow: hidden;
@@ -1529,45 +1676,44 @@ def get_embedded_frontend() -> str:
 
         .bar-track {
             flex: 1;
-            height: clamp(18px, 3vw, 24px);
+            height: var(--bar-height);
             background: var(--bg-tertiary);
             border-radius: var(--radius-md);
             overflow: hidden;
-            display: flex;
+            position: relative;
             box-shadow: inset 0 1px 2px rgba(0,0,0,0.05);
         }
 
+        /* Bars are scaled (not resized) so width changes stay on the compositor */
+        .bar-success, .bar-error {
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            transform-origin: left;
+            transition: transform 0.5s cubic-bezier(0.4, 0, 0.2, 1);
+        }
+
         .bar-success {
             background: var(--color-primary);
-            height: 100%;
-            transition: width 0.5s cubic-bezier(0.4, 0, 0.2, 1);
-            border-radius: var(--radius-sm) 0 0 var(--radius-sm);
+            transform: scaleX(var(--s, 0));
         }
 
         .bar-error {
             background: var(--color-secondary);
-            height: 100%;
-            transition: width 0.5s cubic-bezier(0.4, 0, 0.2, 1);
+            transform: translateX(calc(var(--o, 0) * 100%)) scaleX(var(--s, 0));
         }
 
         .bar-value {
-            width: clamp(40px, 8vw, 55px);
+            width: var(--bar-value-width);
             text-align: right;
-            font-size: clamp(11px, 1.8vw, 13px);
+            font-size: var(--bar-font-size);
             color: var(--text-secondary);
             font-weight: 500;
             font-variant-numeric: tabular-nums;
         }
 
-        @media (max-width: 600px) {
-            .bar-label {
-                width: 50px;
-            }
-            .bar-value {
-                width: 35px;
-            }
-        }
-
         /* Rate Badge - Pill Style */
         .rate-badge {
             display: inline-flex;
@@ -1642,36 +1788,259 @@ def get_embedded_frontend() -> str:
             border-radius: 50%;
             background: var(--color-primary);
         }
+'''
 
 
-        /* Footer */
-        .footer {
-            padding: 16px 24px;
-            text-align: center;
-            color: var(--text-muted);
-            font-size: 11px;
-            border-top: 1px solid var(--border-color);
-        }
-    </style>
-</head>
-<body>
-    <div id="root"></div>
-    <script type="text/babel">
-        const { useState, useEffect, useCallback } = React;
+def get_frontend_app() -> str:
+    """Return the JSX source of the dashboard React app."""
+    return '''
+        const { useState, useEffect, useCallback, useMemo, useRef, memo, useSyncExternalStore, useDeferredValue } = React;
+
+        // Returned by api.fetch when the server answers 304 for the last ETag seen
+        const NOT_MODIFIED = Object.freeze({ notModified: true });
+
+        // Poll every 2s while data is moving; back off to 16s while it is idle
+        const POLL_INTERVAL_MS = 2000;
+        const MAX_POLL_INTERVAL_MS = 16000;
 
         // API Helper
         const api = {
+            _etags: {},
             fetch: async (endpoint, params = {}) => {
-                const url = new URL(endpoint, window.location.origin);
-                Object.entries(params).forEach(([k, v]) => {
-                    if (v !== undefined && v !== null) url.searchParams.set(k, v);
-                });
-                const res = await fetch(url);
+                // Build the query string directly; endpoints are same-origin paths
+                let qs = '';
+                for (const k in params) {
+                    const v = params[k];
+                    if (v === undefined || v === null) continue;
+                    qs += (qs ? '&' : '?') + encodeURIComponent(k) + '=' + encodeURIComponent(v);
+                }
+                const url = endpoint + qs;
+                const etag = api._etags[url];
+                const res = await fetch(url, etag ? { headers: { 'If-None-Match': etag } } : undefined);
+                if (res.status === 304) return NOT_MODIFIED;
                 if (!res.ok) throw new Error('API Error');
-                return res.json();
+                const body = await res.json();
+                const nextEtag = res.headers.get('ETag');
+                if (nextEtag) api._etags[url] = nextEtag;
+                return body;
+            },
+
+            // Page loads requested within the same tick share one /api/dashboard request
+            _queue: [],
+            _timer: 0,
+            load: (page) => new Promise((resolve, reject) => {
+                api._queue.push({ page, resolve, reject });
+                if (!api._timer) api._timer = setTimeout(api._flush, 10);
+            }),
+            _flush: async () => {
+                const items = api._queue.splice(0);
+                api._timer = 0;
+                const pages = [...new Set(items.map(item => item.page))];
+                try {
+                    const result = await api.fetch('/api/dashboard', { pages: pages.join(',') });
+                    items.forEach(item => item.resolve(result === NOT_MODIFIED ? NOT_MODIFIED : result[item.page]));
+                } catch (err) {
+                    items.forEach(item => item.reject(err));
+                }
             }
         };
 
+        // Structural sharing for JSON payloads: returns prev wherever next is deep-equal to it,
+        // and otherwise a fresh container that still reuses every unchanged child
+        function shareStructure(prev, next) {
+            if (prev === next) return prev;
+            if (!prev || !next || typeof prev !== 'object' || typeof next !== 'object') return next;
+            const isArray = Array.isArray(next);
+            if (isArray !== Array.isArray(prev)) return next;
+
+            if (isArray) {
+                let same = prev.length === next.length;
+                const out = new Array(next.length);
+                for (let i = 0; i < next.length; i++) {
+                    out[i] = shareStructure(prev[i], next[i]);
+                    if (out[i] !== prev[i]) same = false;
+                }
+                return same ? prev : out;
+            }
+
+            let same = true;
+            let count = 0;
+            const out = {};
+            for (const key in next) {
+                out[key] = shareStructure(prev[key], next[key]);
+                if (out[key] !== prev[key] || !(key in prev)) same = false;
+                count++;
+            }
+            return same && count === Object.keys(prev).length ? prev : out;
+        }
+
+        // Dashboard store - one poll loop feeds every page through useSyncExternalStore
+        const store = {
+            state: {},
+            page: 'overview',
+            listeners: new Set(),
+            _pending: null,
+            _frame: 0,
+            _timer: 0,
+            _run: 0,
+
+            subscribe: (listener) => {
+                store.listeners.add(listener);
+                if (store.listeners.size === 1) store.startPolling();
+                return () => {
+                    store.listeners.delete(listener);
+                    if (store.listeners.size === 0) store.stopPolling();
+                };
+            },
+            getSnapshot: () => store.state,
+
+            // Switch the polled page and fetch it right away
+            setPage: (page) => {
+                if (page === store.page) return;
+                store.page = page;
+                if (store.listeners.size) store.startPolling();
+            },
+
+            startPolling: () => {
+                const run = ++store._run;
+                let delay = POLL_INTERVAL_MS;
+                clearTimeout(store._timer);
+                const tick = async () => {
+                    const changed = await store.fetch(store.page);
+                    if (run !== store._run) return;
+                    delay = changed ? POLL_INTERVAL_MS : Math.min(delay * 2, MAX_POLL_INTERVAL_MS);
+                    store._timer = setTimeout(tick, delay);
+                };
+                tick();
+            },
+            stopPolling: () => {
+                store._run++;
+                clearTimeout(store._timer);
+                cancelAnimationFrame(store._frame);
+                store._frame = 0;
+            },
+
+            // Resolves true when new data arrived, false on 304 or error
+            fetch: async (page) => {
+                try {
+                    // Always fetch overview for live status indicator (batched into one request)
+                    const [pageResult, overviewResult] = await Promise.all([
+                        api.load(page),
+                        page !== 'overview' ? api.load('overview') : Promise.resolve(null)
+                    ]);
+                    if (pageResult === NOT_MODIFIED) return false;
+                    store.update({
+                        [page]: pageResult,
+                        ...(overviewResult && { overview: overviewResult })
+                    });
+                    return true;
+                } catch (err) {
+                    console.error('API Error:', err);
+                    return false;
+                }
+            },
+
+            // Coalesce poll results into a single notification per animation frame
+            update: (patch) => {
+                store._pending = { ...store._pending, ...patch };
+                if (store._frame) return;
+                store._frame = requestAnimationFrame(() => {
+                    const pending = store._pending;
+                    store._pending = null;
+                    store._frame = 0;
+                    // Share unchanged subtrees with the previous state so memoized pages and rows bail out
+                    const prev = store.state;
+                    let next = prev;
+                    for (const key in pending) {
+                        const slice = shareStructure(prev[key], pending[key]);
+                        if (slice === prev[key]) continue;
+                        if (next === prev) next = { ...prev };
+                        next[key] = slice;
+                    }
+                    if (next === prev) return;
+                    store.state = next;
+                    store.listeners.forEach(listener => listener());
+                });
+            }
+        };
+
+        // Only the live flag of the overview matters to the shell, so select the primitive
+        const selectIsActive = () => !!(store.state.overview && store.state.overview.session.is_active);
+
+        // Static icons are built once; returning the same element lets React skip them
+        const MENU_ICON = (
+            <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round">
+                <line x1="3" y1="12" x2="21" y2="12"/><line x1="3" y1="6" x2="21" y2="6"/><line x1="3" y1="18" x2="21" y2="18"/>
+            </svg>
+        );
+
+        const CLOSE_ICON = (
+            <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round">
+                <line x1="18" y1="6" x2="6" y2="18"/><line x1="6" y1="6" x2="18" y2="18"/>
+            </svg>
+        );
+
+        const SUN_ICON = (
+            <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round">
+                <circle cx="12" cy="12" r="5"/><line x1="12" y1="1" x2="12" y2="3"/><line x1="12" y1="21" x2="12" y2="23"/><line x1="4.22" y1="4.22" x2="5.64" y2="5.64"/><line x1="18.36" y1="18.36" x2="19.78" y2="19.78"/><line x1="1" y1="12" x2="3" y2="12"/><line x1="21" y1="12" x2="23" y2="12"/><line x1="4.22" y1="19.78" x2="5.64" y2="18.36"/><line x1="18.36" y1="5.64" x2="19.78" y2="4.22"/>
+            </svg>
+        );
+
+        const MOON_ICON = (
+            <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round">
+                <path d="M21 12.79A9 9 0 1 1 11.21 3 7 7 0 0 0 21 12.79z"/>
+            </svg>
+        );
+
+        // Per-row status icons: children go in as one innerHTML string, so each icon
+        // mounts as a single node when virtualized rows scroll into view
+        const CHECK_SVG = { __html: '<polyline points="20 6 9 17 4 12"/>' };
+        const X_SVG = { __html: '<line x1="18" y1="6" x2="6" y2="18"/><line x1="6" y1="6" x2="18" y2="18"/>' };
+        const CIRCLE_SVG = { __html: '<circle cx="12" cy="12" r="10"/>' };
+
+        const CHECK_ICON = (
+            <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="3" strokeLinecap="round" strokeLinejoin="round" dangerouslySetInnerHTML={CHECK_SVG} />
+        );
+
+        const X_ICON = (
+            <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="3" strokeLinecap="round" strokeLinejoin="round" dangerouslySetInnerHTML={X_SVG} />
+        );
+
+        const CIRCLE_ICON = (
+            <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round" dangerouslySetInnerHTML={CIRCLE_SVG} />
+        );
+
+        const INBOX_ICON = (
+            <svg width="48" height="48" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="1.5" strokeLinecap="round" strokeLinejoin="round">
+                <polyline points="22 12 16 12 14 15 10 15 8 12 2 12"/><path d="M5.45 5.11L2 12v6a2 2 0 0 0 2 2h16a2 2 0 0 0 2-2v-6l-3.45-6.89A2 2 0 0 0 16.76 4H7.24a2 2 0 0 0-1.79 1.11z"/>
+            </svg>
+        );
+
+        const CHECK_CIRCLE_ICON = (
+            <svg width="48" height="48" viewBox="0 0 24 24" fill="none" stroke="var(--success)" strokeWidth="1.5" strokeLinecap="round" strokeLinejoin="round">
+                <path d="M22 11.08V12a10 10 0 1 1-5.93-9.14"/><polyline points="22 4 12 14.01 9 11.01"/>
+            </svg>
+        );
+
+        const LIGHTBULB_ICON = (
+            <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round">
+                <line x1="9" y1="18" x2="15" y2="18"/><line x1="10" y1="22" x2="14" y2="22"/><path d="M15.09 14c.18-.98.65-1.74 1.41-2.5A4.65 4.65 0 0 0 18 8 6 6 0 0 0 6 8c0 1 .23 2.23 1.5 3.5A4.61 4.61 0 0 1 8.91 14"/>
+            </svg>
+        );
+
+        // Copy button states; sized by .copy-btn svg
+        const COPY_ICON = (
+            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2">
+                <rect x="9" y="9" width="13" height="13" rx="2"/><path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"/>
+            </svg>
+        );
+
+        const COPIED_ICON = (
+            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2">
+                <polyline points="20 6 9 17 4 12"/>
+            </svg>
+        );
+
         // SVG Icons
         const Icons = {
             // Audit Shield Logo - ctx-monitor brand identity
@@ -1681,56 +2050,18 @@ def get_embedded_frontend() -> str:
                     <path d="M28 50H41L47 38L53 62L59 50H72" stroke="var(--logo-pulse)" strokeWidth="5" strokeLinecap="round" strokeLinejoin="round"/>
                 </svg>
             ),
-            Menu: () => (
-                <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round">
-                    <line x1="3" y1="12" x2="21" y2="12"/><line x1="3" y1="6" x2="21" y2="6"/><line x1="3" y1="18" x2="21" y2="18"/>
-                </svg>
-            ),
-            Close: () => (
-                <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round">
-                    <line x1="18" y1="6" x2="6" y2="18"/><line x1="6" y1="6" x2="18" y2="18"/>
-                </svg>
-            ),
-            Sun: () => (
-                <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round">
-                    <circle cx="12" cy="12" r="5"/><line x1="12" y1="1" x2="12" y2="3"/><line x1="12" y1="21" x2="12" y2="23"/><line x1="4.22" y1="4.22" x2="5.64" y2="5.64"/><line x1="18.36" y1="18.36" x2="19.78" y2="19.78"/><line x1="1" y1="12" x2="3" y2="12"/><line x1="21" y1="12" x2="23" y2="12"/><line x1="4.22" y1="19.78" x2="5.64" y2="18.36"/><line x1="18.36" y1="5.64" x2="19.78" y2="4.22"/>
-                </svg>
-            ),
-            Moon: () => (
-                <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round">
-                    <path d="M21 12.79A9 9 0 1 1 11.21 3 7 7 0 0 0 21 12.79z"/>
-                </svg>
-            ),
-            Check: () => (
-                <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="3" strokeLinecap="round" strokeLinejoin="round">
-                    <polyline points="20 6 9 17 4 12"/>
-                </svg>
-            ),
-            X: () => (
-                <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="3" strokeLinecap="round" strokeLinejoin="round">
-                    <line x1="18" y1="6" x2="6" y2="18"/><line x1="6" y1="6" x2="18" y2="18"/>
-                </svg>
-            ),
-            Circle: () => (
-                <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round">
-                    <circle cx="12" cy="12" r="10"/>
-                </svg>
-            ),
-            Inbox: () => (
-                <svg width="48" height="48" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="1.5" strokeLinecap="round" strokeLinejoin="round">
-                    <polyline points="22 12 16 12 14 15 10 15 8 12 2 12"/><path d="M5.45 5.11L2 12v6a2 2 0 0 0 2 2h16a2 2 0 0 0 2-2v-6l-3.45-6.89A2 2 0 0 0 16.76 4H7.24a2 2 0 0 0-1.79 1.11z"/>
-                </svg>
-            ),
-            CheckCircle: () => (
-                <svg width="48" height="48" viewBox="0 0 24 24" fill="none" stroke="var(--success)" strokeWidth="1.5" strokeLinecap="round" strokeLinejoin="round">
-                    <path d="M22 11.08V12a10 10 0 1 1-5.93-9.14"/><polyline points="22 4 12 14.01 9 11.01"/>
-                </svg>
-            ),
-            Lightbulb: () => (
-                <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round">
-                    <line x1="9" y1="18" x2="15" y2="18"/><line x1="10" y1="22" x2="14" y2="22"/><path d="M15.09 14c.18-.98.65-1.74 1.41-2.5A4.65 4.65 0 0 0 18 8 6 6 0 0 0 6 8c0 1 .23 2.23 1.5 3.5A4.61 4.61 0 0 1 8.91 14"/>
-                </svg>
-            )
+            Menu: () => MENU_ICON,
+            Close: () => CLOSE_ICON,
+            Sun: () => SUN_ICON,
+            Moon: () => MOON_ICON,
+            Check: () => CHECK_ICON,
+            X: () => X_ICON,
+            Circle: () => CIRCLE_ICON,
+            Inbox: () => INBOX_ICON,
+            CheckCircle: () => CHECK_CIRCLE_ICON,
+            Lightbulb: () => LIGHTBULB_ICON,
+            Copy: () => COPY_ICON,
+            Copied: () => COPIED_ICON
         };
 
         // Helper: Format duration in seconds to human readable
@@ -1752,6 +2083,17 @@ def get_embedded_frontend() -> str:
             return count.toString();
         }
 
+        // Helper: Locale-aware number formatting through one shared Intl instance
+        const NUMBER_FORMAT = new Intl.NumberFormat();
+        function formatNumber(n) {
+            return NUMBER_FORMAT.format(n);
+        }
+
+        // Shared style for error-count cells; frozen so rows pass the same object every render
+        const ERROR_COUNT_STYLE = Object.freeze({ color: 'var(--error)' });
+        const NO_ERROR_COUNT_STYLE = Object.freeze({ color: 'inherit' });
+        const errorCountStyle = (errors) => errors > 0 ? ERROR_COUNT_STYLE : NO_ERROR_COUNT_STYLE;
+
         // Sparkline Component
         function Sparkline({ data = [], height = 24, color = 'var(--accent-primary)' }) {
             const max = Math.max(...data, 1);
@@ -1776,35 +2118,120 @@ def get_embedded_frontend() -> str:
             const pct = Math.min((value / max) * 100, 100);
             return (
                 <div className="progress">
-                    <div className="progress-fill" style={{ width: `${pct}%` }} />
+                    <div className="progress-fill" style={{ '--p': pct / 100 }} />
                 </div>
             );
         }
 
         // Rate Circle
-        function RateCircle({ rate }) {
+        function RateCircle({ rate, label }) {
             const className = rate >= 95 ? 'rate-excellent'
                 : rate >= 80 ? 'rate-good'
                 : rate >= 60 ? 'rate-warning'
                 : 'rate-poor';
             return (
                 <span className={`rate-badge ${className}`}>
-                    {rate.toFixed(0)}%
+                    {label || rate.toFixed(0) + '%'}
                 </span>
             );
         }
 
-        // Overview Page
-        function OverviewPage({ data }) {
+        // Virtualized List - mounts only the rows inside the viewport (plus overscan)
+        function VirtualList({ items, itemHeight, height, overscan = 8, className, renderRow }) {
+            const [scrollTop, setScrollTop] = useState(0);
+            const onScroll = useCallback((e) => setScrollTop(e.currentTarget.scrollTop), []);
+            const totalHeight = items.length * itemHeight;
+            const start = Math.max(0, Math.floor(scrollTop / itemHeight) - overscan);
+            const end = Math.min(items.length, Math.ceil((scrollTop + height) / itemHeight) + overscan);
+            const rows = [];
+            for (let i = start; i < end; i++) {
+                rows.push(renderRow(items[i], i, i * itemHeight));
+            }
+            return (
+                <div className={className} style={{ height: Math.min(height, totalHeight), overflowY: 'auto' }} onScroll={onScroll}>
+                    <div style={{ height: totalHeight, position: 'relative' }}>{rows}</div>
+                </div>
+            );
+        }
 
-            const [copiedCmd, setCopiedCmd] = React.useState(null);
+        // Timeline event row - positioned with translateY so scrolling only composites
+        const EVENT_ROW_HEIGHT = 44;
+        const EventRow = memo(function EventRow({ event, offset }) {
+            return (
+                <div className="event-item virtual-row" style={{ height: EVENT_ROW_HEIGHT, transform: `translateY(${offset}px)` }}>
+                    <span className="event-time">{event.time}</span>
+                    <span className="event-type">{event.event_type}</span>
+                    <span className="event-tool">{event.tool_name}</span>
+                    <span className={`event-status ${event.status}`}>
+                        {event.status === 'success' ? <Icons.Check /> : event.status === 'error' ? <Icons.X /> : <Icons.Circle />}
+                    </span>
+                </div>
+            );
+        });
 
-            const copyToClipboard = (text) => {
-                navigator.clipboard.writeText(text).then(() => {
-                    setCopiedCmd(text);
-                    setTimeout(() => setCopiedCmd(null), 2000);
-                });
-            };
+        const renderEventRow = (event, i, offset) => <EventRow key={i} event={event} offset={offset} />;
+
+        // Row wrapper that reports its rendered height (e.g. after an alert expands)
+        function MeasuredRow({ rowKey, offset, onMeasure, children }) {
+            const ref = useRef(null);
+            useEffect(() => {
+                const el = ref.current;
+                const observer = new ResizeObserver(() => onMeasure(rowKey, el.offsetHeight));
+                observer.observe(el);
+                return () => observer.disconnect();
+            }, [rowKey, onMeasure]);
+            return (
+                <div ref={ref} className="virtual-row" style={{ transform: `translateY(${offset}px)` }}>
+                    {children}
+                </div>
+            );
+        }
+
+        // Variable-height virtualized list - rows are measured once mounted and
+        // unmeasured rows fall back to estimatedHeight
+        function VariableVirtualList({ items, getKey, estimatedHeight, height, overscan = 4, className, renderRow }) {
+            const [scrollTop, setScrollTop] = useState(0);
+            const [, setLayoutVersion] = useState(0);
+            const heightsRef = useRef(new Map());
+            const onScroll = useCallback((e) => setScrollTop(e.currentTarget.scrollTop), []);
+            const onMeasure = useCallback((key, h) => {
+                if (heightsRef.current.get(key) === h) return;
+                heightsRef.current.set(key, h);
+                setLayoutVersion(v => v + 1);
+            }, []);
+
+            const offsets = [0];
+            for (let i = 0; i < items.length; i++) {
+                const measured = heightsRef.current.get(getKey(items[i]));
+                offsets.push(offsets[i] + (measured === undefined ? estimatedHeight : measured));
+            }
+            const totalHeight = offsets[items.length];
+
+            let start = 0;
+            while (start < items.length && offsets[start + 1] <= scrollTop) start++;
+            let end = start;
+            while (end < items.length && offsets[end] < scrollTop + height) end++;
+            start = Math.max(0, start - overscan);
+            end = Math.min(items.length, end + overscan);
+
+            const rows = [];
+            for (let i = start; i < end; i++) {
+                const key = getKey(items[i]);
+                rows.push(
+                    <MeasuredRow key={key} rowKey={key} offset={offsets[i]} onMeasure={onMeasure}>
+                        {renderRow(items[i], i)}
+                    </MeasuredRow>
+                );
+            }
+            return (
+                <div className={className} style={{ height: Math.min(height, totalHeight), overflowY: 'auto' }} onScroll={onScroll}>
+                    <div style={{ height: totalHeight, position: 'relative' }}>{rows}</div>
+                </div>
+            );
+        }
+
+        // Overview Page
+        const OverviewPage = memo(function OverviewPage({ data }) {
 
             if (!data) return <div className="loading"><div className="spinner" />Loading...</div>;
 
@@ -1845,7 +2272,7 @@ def get_embedded_frontend() -> str:
                     {/* Token Usage */}
                     <div className="card">
                         <div className="card-header">
-                            <span className="card-title">Token Usage - {data.tokens.used.toLocaleString()}</span>
+                            <span className="card-title">Token Usage - {formatNumber(data.tokens.used)}</span>
                             <span style={{ color: 'var(--text-secondary)', fontSize: '12px' }}>
                                 {((data.tokens.used / data.tokens.available) * 100).toFixed(1)}% used
                             </span>
@@ -1855,7 +2282,7 @@ def get_embedded_frontend() -> str:
                             <div className="grid grid-5" style={{ marginTop: '16px' }}>
                                 {Object.entries(data.tokens.breakdown).map(([key, value]) => (
                                     <div key={key} style={{ textAlign: 'center' }}>
-                                        <div style={{ fontSize: '16px', fontWeight: '600' }}>{value.toLocaleString()}</div>
+                                        <div style={{ fontSize: '16px', fontWeight: '600' }}>{formatNumber(value)}</div>
                                         <div style={{ fontSize: '11px', color: 'var(--text-secondary)', textTransform: 'capitalize' }}>{key}</div>
                                     </div>
                                 ))}
@@ -1891,19 +2318,44 @@ def get_embedded_frontend() -> str:
                     </div>
                 </div>
             );
-        }
+        });
 
-        // Tools Page
-        function ToolsPage({ data }) {
-
-            const [copiedCmd, setCopiedCmd] = React.useState(null);
+        // Tool call distribution bar
+        const BarRow = memo(function BarRow({ name, calls, successPct, errorPct }) {
+            return (
+                <div className="bar-row">
+                    <span className="bar-label">{name}</span>
+                    <div className="bar-track">
+                        <div className="bar-success" style={{ '--s': successPct / 100 }} />
+                        <div className="bar-error" style={{ '--o': successPct / 100, '--s': errorPct / 100 }} />
+                    </div>
+                    <span className="bar-value">{calls}</span>
+                </div>
+            );
+        });
 
-            const copyToClipboard = (text) => {
-                navigator.clipboard.writeText(text).then(() => {
-                    setCopiedCmd(text);
-                    setTimeout(() => setCopiedCmd(null), 2000);
-                });
-            };
+        // Tools Page
+        const ToolsPage = memo(function ToolsPage({ data }) {
+
+            // Bar geometry and formatted cells, computed once per payload
+            const tools = data && data.tools;
+            const rows = useMemo(() => {
+                if (!tools) return [];
+                let maxCalls = 1;
+                for (const t of tools) if (t.calls > maxCalls) maxCalls = t.calls;
+                return tools.map(t => ({
+                    name: t.name,
+                    calls: t.calls,
+                    success: t.success,
+                    errors: t.errors,
+                    rate: t.rate,
+                    successPct: (t.success / maxCalls) * 100,
+                    errorPct: (t.errors / maxCalls) * 100,
+                    rateStr: t.rate.toFixed(0) + '%',
+                    meanTimeStr: t.mean_time.toFixed(2) + 's',
+                    stdevTimeStr: t.stdev_time.toFixed(2) + 's'
+                }));
+            }, [tools]);
 
             if (!data) return <div className="loading"><div className="spinner" />Loading...</div>;
 
@@ -1938,21 +2390,9 @@ def get_embedded_frontend() -> str:
                         </div>
                         <div className="card-body">
                             <div className="bar-chart">
-                                {data.tools.map(tool => {
-                                    const maxCalls = Math.max(...data.tools.map(t => t.calls), 1);
-                                    const successPct = (tool.success / maxCalls) * 100;
-                                    const errorPct = (tool.errors / maxCalls) * 100;
-                                    return (
-                                        <div key={tool.name} className="bar-row">
-                                            <span className="bar-label">{tool.name}</span>
-                                            <div className="bar-track">
-                                                <div className="bar-success" style={{ width: `${successPct}%` }} />
-                                                <div className="bar-error" style={{ width: `${errorPct}%` }} />
-                                            </div>
-                                            <span className="bar-value">{tool.calls}</span>
-                                        </div>
-                                    );
-                                })}
+                                {rows.map(r => (
+                                    <BarRow key={r.name} name={r.name} calls={r.calls} successPct={r.successPct} errorPct={r.errorPct} />
+                                ))}
                             </div>
                         </div>
                     </div>
@@ -1975,15 +2415,15 @@ def get_embedded_frontend() -> str:
                                 </tr>
                             </thead>
                             <tbody>
-                                {data.tools.map(tool => (
-                                    <tr key={tool.name}>
-                                        <td style={{ fontWeight: '500', color: 'var(--accent-primary)' }}>{tool.name}</td>
-                                        <td>{tool.calls}</td>
-                                        <td style={{ color: 'var(--success)' }}>{tool.success}</td>
-                                        <td style={{ color: tool.errors > 0 ? 'var(--error)' : 'inherit' }}>{tool.errors}</td>
-                                        <td><RateCircle rate={tool.rate} /></td>
-                                        <td>{tool.mean_time.toFixed(2)}s</td>
-                                        <td>{tool.stdev_time.toFixed(2)}s</td>
+                                {rows.map(r => (
+                                    <tr key={r.name}>
+                                        <td style={{ fontWeight: '500', color: 'var(--accent-primary)' }}>{r.name}</td>
+                                        <td>{r.calls}</td>
+                                        <td style={{ color: 'var(--success)' }}>{r.success}</td>
+                                        <td style={errorCountStyle(r.errors)}>{r.errors}</td>
+                                        <td><RateCircle rate={r.rate} label={r.rateStr} /></td>
+                                        <td>{r.meanTimeStr}</td>
+                                        <td>{r.stdevTimeStr}</td>
                                     </tr>
                                 ))}
                             </tbody>
@@ -1991,19 +2431,36 @@ def get_embedded_frontend() -> str:
                     </div>
                 </div>
             );
-        }
+        });
+
+        // Event distribution chip styles (stable references skip style diffing)
+        const CHIP_LIST_STYLE = { display: 'flex', flexWrap: 'wrap', gap: '12px' };
+        const CHIP_STYLE = {
+            padding: '8px 16px',
+            background: 'var(--bg-tertiary)',
+            borderRadius: 'var(--radius-sm)',
+            display: 'flex',
+            alignItems: 'center',
+            gap: '8px'
+        };
+        const CHIP_LABEL_STYLE = { fontWeight: '500' };
+        const CHIP_COUNT_STYLE = {
+            background: 'var(--accent-primary)',
+            color: 'var(--brand-white)',
+            padding: '2px 8px',
+            borderRadius: '9999px',
+            fontSize: '11px',
+            fontWeight: '600'
+        };
 
         // Timeline Page
-        function TimelinePage({ data }) {
-
-            const [copiedCmd, setCopiedCmd] = React.useState(null);
+        const TimelinePage = memo(function TimelinePage({ data }) {
 
-            const copyToClipboard = (text) => {
-                navigator.clipboard.writeText(text).then(() => {
-                    setCopiedCmd(text);
-                    setTimeout(() => setCopiedCmd(null), 2000);
-                });
-            };
+            const distribution = data && data.distribution;
+            const sortedDist = useMemo(
+                () => distribution ? Object.entries(distribution).sort((a, b) => b[1] - a[1]) : [],
+                [distribution]
+            );
 
             if (!data) return <div className="loading"><div className="spinner" />Loading...</div>;
 
@@ -2018,25 +2475,11 @@ def get_embedded_frontend() -> str:
                             </span>
                         </div>
                         <div className="card-body">
-                            <div style={{ display: 'flex', flexWrap: 'wrap', gap: '12px' }}>
-                                {Object.entries(data.distribution).sort((a, b) => b[1] - a[1]).map(([type, count]) => (
-                                    <div key={type} style={{
-                                        padding: '8px 16px',
-                                        background: 'var(--bg-tertiary)',
-                                        borderRadius: 'var(--radius-sm)',
-                                        display: 'flex',
-                                        alignItems: 'center',
-                                        gap: '8px'
-                                    }}>
-                                        <span style={{ fontWeight: '500' }}>{type}</span>
-                                        <span style={{
-                                            background: 'var(--accent-primary)',
-                                            color: 'var(--brand-white)',
-                                            padding: '2px 8px',
-                                            borderRadius: '9999px',
-                                            fontSize: '11px',
-                                            fontWeight: '600'
-                                        }}>{count}</span>
+                            <div style={CHIP_LIST_STYLE}>
+                                {sortedDist.map(([type, count]) => (
+                                    <div key={type} style={CHIP_STYLE}>
+                                        <span style={CHIP_LABEL_STYLE}>{type}</span>
+                                        <span style={CHIP_COUNT_STYLE}>{count}</span>
                                     </div>
                                 ))}
                             </div>
@@ -2048,72 +2491,268 @@ def get_embedded_frontend() -> str:
                         <div className="card-header">
                             <span className="card-title">Recent Events</span>
                         </div>
-                        <div className="event-stream">
-                            {data.events.length === 0 ? (
+                        {data.events.length === 0 ? (
+                            <div className="event-stream">
                                 <div className="empty-state">
                                     <div className="empty-state-icon"><Icons.Inbox /></div>
                                     <div className="empty-state-title">No events yet</div>
                                     <p>Events will appear here as they occur</p>
                                 </div>
-                            ) : (
-                                data.events.map((event, i) => (
-                                    <div key={i} className="event-item">
-                                        <span className="event-time">{event.time}</span>
-                                        <span className="event-type">{event.event_type}</span>
-                                        <span className="event-tool">{event.tool_name}</span>
-                                        <span className={`event-status ${event.status}`}>
-                                            {event.status === 'success' ? <Icons.Check /> : event.status === 'error' ? <Icons.X /> : <Icons.Circle />}
-                                        </span>
+                            </div>
+                        ) : (
+                            <VirtualList
+                                className="event-stream"
+                                items={data.events}
+                                itemHeight={EVENT_ROW_HEIGHT}
+                                height={400}
+                                renderRow={renderEventRow}
+                            />
+                        )}
+                    </div>
+                </div>
+            );
+        });
+
+        // Alerts beyond this count are virtualized; collapsed rows are about 72px tall
+        const ALERT_VIRTUALIZE_THRESHOLD = 50;
+        const ALERT_ROW_HEIGHT = 72;
+
+        // 32-bit FNV-1a over UTF-16 code units; no per-character allocation
+        function hashMsg(s) {
+            let h = 2166136261;
+            for (let i = 0; i < s.length; i++) {
+                h ^= s.charCodeAt(i);
+                h = Math.imul(h, 16777619);
+            }
+            return (h >>> 0).toString(36);
+        }
+
+        // Stable per-alert id; falls back to a hash of the message for alerts without one
+        function getAlertId(alert) {
+            return alert.id || ('alert_' + hashMsg(alert.message || ''));
+        }
+
+        const alertKey = (alert) => alert.id;
+
+        // Severity palette and display order
+        const SEV_COLORS = {
+            CRITICAL: 'var(--error)',
+            HIGH: '#F97316',
+            MEDIUM: 'var(--warning)',
+            LOW: 'var(--info)',
+            INFO: 'var(--text-muted)'
+        };
+        const SEVERITIES = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'INFO'];
+
+        // Alert severity label styles; anything below MEDIUM shares the LOW style
+        const SEVERITY_STYLE = Object.freeze({
+            CRITICAL: Object.freeze({ color: SEV_COLORS.CRITICAL }),
+            HIGH: Object.freeze({ color: SEV_COLORS.HIGH }),
+            MEDIUM: Object.freeze({ color: SEV_COLORS.MEDIUM }),
+            LOW: Object.freeze({ color: SEV_COLORS.LOW })
+        });
+
+        // Severity count card - skips rendering while its count is unchanged
+        const SevCard = memo(function SevCard({ sev, count }) {
+            return (
+                <div className="card metric-card">
+                    <div className="metric-value" style={{ color: SEV_COLORS[sev] }}>{count}</div>
+                    <div className="metric-label">{sev}</div>
+                </div>
+            );
+        });
+
+        // Minimal observable value for useSyncExternalStore
+        function createStore(initial) {
+            let value = initial;
+            const listeners = new Set();
+            return {
+                get: () => value,
+                set: (next) => {
+                    if (next === value) return;
+                    value = next;
+                    listeners.forEach(listener => listener());
+                },
+                subscribe: (listener) => {
+                    listeners.add(listener);
+                    return () => listeners.delete(listener);
+                }
+            };
+        }
+
+        // Last copied action command; only the copy buttons showing it re-render
+        const copiedStore = createStore(null);
+        let copiedTimer = 0;
+
+        function copyCommand(text) {
+            navigator.clipboard.writeText(text).then(() => {
+                copiedStore.set(text);
+                clearTimeout(copiedTimer);
+                copiedTimer = setTimeout(() => copiedStore.set(null), 2000);
+            });
+        }
+
+        const CopyButton = memo(function CopyButton({ cmd }) {
+            const copied = useSyncExternalStore(copiedStore.subscribe, () => copiedStore.get() === cmd);
+            return (
+                <button className={"copy-btn" + (copied ? " copied" : "")} data-action="copy" data-cmd={cmd} title={copied ? "Copied!" : "Copy to clipboard"}>
+                    {copied ? <Icons.Copied /> : <Icons.Copy />}
+                </button>
+            );
+        });
+
+        // Alert row - memoized so toggling one alert leaves the other rows untouched.
+        // Clicks are handled by AlertsPage through the data-action attributes.
+        const AlertRow = memo(function AlertRow({ alert, alertId, isExpanded }) {
+            const hasDetails = alert.related_events && alert.related_events.length > 0;
+
+            return (
+                <div
+                    className={"alert-item" + (hasDetails ? " expandable" : "") + (isExpanded ? " expanded" : "")}
+                    data-alert-id={alertId}
+                    data-action={hasDetails ? "toggle" : undefined}
+                >
+                    <div className="alert-header">
+                        <div className={"alert-indicator " + alert.severity.toLowerCase()} />
+                        <div className="alert-content">
+                            <div className="alert-severity" style={SEVERITY_STYLE[alert.severity] || SEVERITY_STYLE.LOW}>
+                                {alert.severity}
+                            </div>
+                            <div className="alert-message">{alert.message}</div>
+                        </div>
+                        {hasDetails && (
+                            <button className="alert-expand-btn" data-action="toggle">
+                                {isExpanded ? 'Hide' : 'Details'}
+                            </button>
+                        )}
+                    </div>
+
+                    {hasDetails && (
+                        <div className="alert-details" data-action="none">
+                            {/* Related Events */}
+                            <div className="alert-section">
+                                <div className="alert-section-title">Affected Events (last {alert.related_events.length})</div>
+                                <div className="alert-events">
+                                    {alert.related_events.map((ev, j) => (
+                                        <div key={j} className="alert-event">
+                                            <span className="alert-event-time">{ev.timestamp}</span>
+                                            <span className="alert-event-type">{ev.event_type}</span>
+                                            <span className="alert-event-tool">{ev.tool_name}</span>
+                                            <span className="alert-event-args" title={ev.args_preview || ev.error_message || '-'}>{ev.args_preview || ev.error_message || '-'}</span>
+                                        </div>
+                                    ))}
+                                </div>
+                            </div>
+
+                            {/* Timeline */}
+                            {alert.first_occurrence && (
+                                <div className="alert-section">
+                                    <div className="alert-section-title">Timeline</div>
+                                    <div className="alert-timeline">
+                                        <div className="alert-timeline-item">
+                                            <span className="alert-timeline-label">First</span>
+                                            <span className="alert-timeline-value">{alert.first_occurrence}</span>
+                                        </div>
+                                        <div className="alert-timeline-item">
+                                            <span className="alert-timeline-label">Last</span>
+                                            <span className="alert-timeline-value">{alert.last_occurrence}</span>
+                                        </div>
+                                        <div className="alert-timeline-item">
+                                            <span className="alert-timeline-label">Count</span>
+                                            <span className="alert-timeline-value">{alert.occurrences_count}</span>
+                                        </div>
                                     </div>
-                                ))
+                                </div>
+                            )}
+
+                            {/* Recommendation */}
+                            <div className="alert-section">
+                                <div className="alert-section-title">Possible Causes</div>
+                                <div className="alert-causes">{alert.recommendation}</div>
+                            </div>
+
+                            {/* Action Command */}
+                            {alert.action_command && (
+                                <div className="alert-section">
+                                    <div className="alert-section-title">Recommended Action</div>
+                                    <div className="alert-action">
+                                        <span>Run:</span>
+                                        <code>{alert.action_command}</code>
+                                        <CopyButton cmd={alert.action_command} />
+                                    </div>
+                                </div>
                             )}
                         </div>
-                    </div>
+                    )}
                 </div>
             );
-        }
+        });
 
-        // Alerts Page
-        function AlertsPage({ data, expandedAlerts, setExpandedAlerts }) {
+        // Non-virtualized alert lists mount this many rows per idle slice
+        const ALERT_RENDER_CHUNK = 20;
 
+        // requestIdleCallback with a timer fallback for browsers without it (Safari)
+        const scheduleIdle = window.requestIdleCallback
+            ? (cb) => window.requestIdleCallback(cb)
+            : (cb) => setTimeout(cb, 1);
+        const cancelIdle = window.cancelIdleCallback
+            ? (handle) => window.cancelIdleCallback(handle)
+            : (handle) => clearTimeout(handle);
 
-            const [copiedCmd, setCopiedCmd] = React.useState(null);
+        // Alerts Page
+        const AlertsPage = memo(function AlertsPage({ data, expandedAlerts, setExpandedAlerts }) {
+            // Stable handlers so memoized AlertRows can bail out
+            const toggleAlert = useCallback((id) => {
+                setExpandedAlerts(prev => ({ ...prev, [id]: !prev[id] }));
+            }, [setExpandedAlerts]);
+
+            // One delegated listener for every row; the innermost data-action decides what a click does
+            const handleAlertsClick = useCallback((e) => {
+                const target = e.target.closest('[data-action]');
+                if (!target) return;
+                if (target.dataset.action === 'toggle') {
+                    toggleAlert(target.closest('[data-alert-id]').dataset.alertId);
+                } else if (target.dataset.action === 'copy') {
+                    copyCommand(target.dataset.cmd);
+                }
+            }, [toggleAlert]);
+
+            // Resolve alert ids once per payload instead of hashing messages on every render.
+            // The list follows a deferred copy so a large poll result never blocks an expand click.
+            const rawAlerts = useDeferredValue(data && data.alerts);
+            const alerts = useMemo(
+                () => (rawAlerts || []).map(alert => alert.id ? alert : { ...alert, id: getAlertId(alert) }),
+                [rawAlerts]
+            );
 
-            const copyToClipboard = (text) => {
-                navigator.clipboard.writeText(text).then(() => {
-                    setCopiedCmd(text);
-                    setTimeout(() => setCopiedCmd(null), 2000);
-                });
-            };
+            // Mount the first chunk right away and the rest in idle time, so no single commit is long
+            const [visibleCount, setVisibleCount] = useState(ALERT_RENDER_CHUNK);
+            useEffect(() => {
+                if (visibleCount >= alerts.length || alerts.length > ALERT_VIRTUALIZE_THRESHOLD) return;
+                const handle = scheduleIdle(() => setVisibleCount(c => c + ALERT_RENDER_CHUNK));
+                return () => cancelIdle(handle);
+            }, [visibleCount, alerts.length]);
 
             if (!data) return <div className="loading"><div className="spinner" />Loading...</div>;
 
-            const toggleAlert = (id) => {
-                setExpandedAlerts(prev => {
-                    return {
-                    ...prev,
-                    [id]: !prev[id]
-                    };
-                });
+            const renderAlert = (alert) => {
+                const alertId = alert.id;
+                return (
+                    <AlertRow
+                        key={alertId}
+                        alert={alert}
+                        alertId={alertId}
+                        isExpanded={!!expandedAlerts[alertId]}
+                    />
+                );
             };
 
             return (
                 <div className="grid" style={{ gap: '24px' }}>
                     {/* Alert Counts */}
                     <div className="grid grid-5">
-                        {['CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'INFO'].map(sev => (
-                            <div key={sev} className="card metric-card">
-                                <div className="metric-value" style={{
-                                    color: sev === 'CRITICAL' ? 'var(--error)'
-                                        : sev === 'HIGH' ? '#F97316'
-                                        : sev === 'MEDIUM' ? 'var(--warning)'
-                                        : sev === 'LOW' ? 'var(--info)'
-                                        : 'var(--text-muted)'
-                                }}>
-                                    {data.counts[sev]}
-                                </div>
-                                <div className="metric-label">{sev}</div>
-                            </div>
+                        {SEVERITIES.map(sev => (
+                            <SevCard key={sev} sev={sev} count={data.counts[sev]} />
                         ))}
                     </div>
 
@@ -2125,122 +2764,101 @@ def get_embedded_frontend() -> str:
                                 {data.actionable} actionable
                             </span>
                         </div>
-                        <div>
-                            {data.alerts.length === 0 ? (
+                        <div onClick={handleAlertsClick}>
+                            {alerts.length === 0 ? (
                                 <div className="empty-state">
                                     <div className="empty-state-icon"><Icons.CheckCircle /></div>
                                     <div className="empty-state-title">All Clear!</div>
                                     <p>No active alerts. System is healthy.</p>
                                 </div>
+                            ) : alerts.length > ALERT_VIRTUALIZE_THRESHOLD ? (
+                                <VariableVirtualList
+                                    items={alerts}
+                                    getKey={alertKey}
+                                    estimatedHeight={ALERT_ROW_HEIGHT}
+                                    height={600}
+                                    renderRow={renderAlert}
+                                />
                             ) : (
-                                data.alerts.map((alert, i) => {
-                                    const alertId = alert.id || ('alert_' + (alert.message || '').split('').reduce((h, c) => ((h << 5) - h) + c.charCodeAt(0), 0).toString(36));
-                                    const isExpanded = expandedAlerts[alertId];
-                                    const hasDetails = alert.related_events && alert.related_events.length > 0;
-
-                                    return (
-                                        <div
-                                            key={alertId}
-                                            className={"alert-item" + (hasDetails ? " expandable" : "") + (isExpanded ? " expanded" : "")}
-                                            onClick={() => hasDetails && toggleAlert(alertId)}
-                                        >
-                                            <div className="alert-header">
-                                                <div className={"alert-indicator " + alert.severity.toLowerCase()} />
-                                                <div className="alert-content">
-                                                    <div className="alert-severity" style={{
-                                                        color: alert.severity === 'CRITICAL' ? 'var(--error)'
-                                                            : alert.severity === 'HIGH' ? '#F97316'
-                                                            : alert.severity === 'MEDIUM' ? 'var(--warning)'
-                                                            : 'var(--info)'
-                                                    }}>
-                                                        {alert.severity}
-                                                    </div>
-                                                    <div className="alert-message">{alert.message}</div>
-                                                </div>
-                                                {hasDetails && (
-                                                    <button className="alert-expand-btn" onClick={(e) => { e.stopPropagation(); toggleAlert(alertId); }}>
-                                                        {isExpanded ? 'Hide' : 'Details'}
-                                                    </button>
-                                                )}
-                                            </div>
-
-                                            {hasDetails && (
-                                                <div className="alert-details" onClick={(e) => e.stopPropagation()}>
-                                                    {/* Related Events */}
-                                                    <div className="alert-section">
-                                                        <div className="alert-section-title">Affected Events (last {alert.related_events.length})</div>
-                                                        <div className="alert-events">
-                                                            {alert.related_events.map((ev, j) => (
-                                                                <div key={j} className="alert-event">
-                                                                    <span className="alert-event-time">{ev.timestamp}</span>
-                                                                    <span className="alert-event-type">{ev.event_type}</span>
-                                                                    <span className="alert-event-tool">{ev.tool_name}</span>
-                                                                    <span className="alert-event-args" title={ev.args_preview || ev.error_message || '-'}>{ev.args_preview || ev.error_message || '-'}</span>
-                                                                </div>
-                                                            ))}
-                                                        </div>
-                                                    </div>
-
-                                                    {/* Timeline */}
-                                                    {alert.first_occurrence && (
-                                                        <div className="alert-section">
-                                                            <div className="alert-section-title">Timeline</div>
-                                                            <div className="alert-timeline">
-                                                                <div className="alert-timeline-item">
-                                                                    <span className="alert-timeline-label">First</span>
-                                                                    <span className="alert-timeline-value">{alert.first_occurrence}</span>
-                                                                </div>
-                                                                <div className="alert-timeline-item">
-                                                                    <span className="alert-timeline-label">Last</span>
-                                                                    <span className="alert-timeline-value">{alert.last_occurrence}</span>
-                                                                </div>
-                                                                <div className="alert-timeline-item">
-                                                                    <span className="alert-timeline-label">Count</span>
-                                                                    <span className="alert-timeline-value">{alert.occurrences_count}</span>
-                                                                </div>
-                                                            </div>
-                                                        </div>
-                                                    )}
-
-                                                    {/* Recommendation */}
-                                                    <div className="alert-section">
-                                                        <div className="alert-section-title">Possible Causes</div>
-                                                        <div className="alert-causes">{alert.recommendation}</div>
-                                                    </div>
-
-                                                    {/* Action Command */}
-                                                    {alert.action_command && (
-                                                        <div className="alert-section">
-                                                            <div className="alert-section-title">Recommended Action</div>
-                                                            <div className="alert-action">
-                                                                <span>Run:</span>
-                                                                <code>{alert.action_command}</code>
-                                                                <button className={"copy-btn" + (copiedCmd === alert.action_command ? " copied" : "")} onClick={(e) => { e.stopPropagation(); copyToClipboard(alert.action_command); }} title={copiedCmd === alert.action_command ? "Copied!" : "Copy to clipboard"}>{copiedCmd === alert.action_command ? (<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2"><polyline points="20 6 9 17 4 12"></polyline></svg>) : (<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2"><rect x="9" y="9" width="13" height="13" rx="2"></rect><path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"></path></svg>)}</button>
-                                                            </div>
-                                                        </div>
-                                                    )}
-                                                </div>
-                                            )}
-                                        </div>
-                                    );
-                                })
+                                alerts.slice(0, visibleCount).map(renderAlert)
                             )}
                         </div>
                     </div>
                 </div>
             );
+        });
+
+        // Stack lists beyond this count are virtualized into fixed-height rows
+        const STACK_VIRTUALIZE_THRESHOLD = 50;
+        const STACK_ROW_HEIGHT = 44;
+
+        const StackRow = memo(function StackRow({ name, detail, offset }) {
+            return (
+                <div className="stack-row virtual-row" style={{ height: STACK_ROW_HEIGHT, transform: `translateY(${offset}px)` }}>
+                    <span className="stack-row-name">{name}</span>
+                    <span className="stack-row-detail">{detail}</span>
+                </div>
+            );
+        });
+
+        // Stack component list - plain markup while short, windowed once it grows
+        function StackList({ items, renderItem, describe }) {
+            if (items.length <= STACK_VIRTUALIZE_THRESHOLD) return items.map(renderItem);
+            return (
+                <VirtualList
+                    items={items}
+                    itemHeight={STACK_ROW_HEIGHT}
+                    height={320}
+                    renderRow={(item, i, offset) => <StackRow key={i} name={item.name} detail={describe(item)} offset={offset} />}
+                />
+            );
         }
-        // Stack Page
-        function StackPage({ data }) {
 
-            const [copiedCmd, setCopiedCmd] = React.useState(null);
+        const describeRule = (source) => `${source.tokens} tokens • ${source.lines} lines`;
+        const describeTokens = (item) => `${item.tokens} tokens`;
 
-            const copyToClipboard = (text) => {
-                navigator.clipboard.writeText(text).then(() => {
-                    setCopiedCmd(text);
-                    setTimeout(() => setCopiedCmd(null), 2000);
-                });
-            };
+        // Stack rows take primitive props so memo holds across polls that rebuild the payload
+        const RuleItem = memo(function RuleItem({ name, tokens, lines }) {
+            return (
+                <div style={{ marginBottom: '12px' }}>
+                    <div style={{ fontWeight: '500', marginBottom: '4px' }}>{name}</div>
+                    <div style={{ fontSize: '11px', color: 'var(--text-secondary)' }}>
+                        {tokens} tokens • {lines} lines
+                    </div>
+                </div>
+            );
+        });
+
+        const TokenItem = memo(function TokenItem({ name, tokens }) {
+            return (
+                <div style={{ marginBottom: '8px' }}>
+                    <span style={{ fontWeight: '500' }}>{name}</span>
+                    <span style={{ color: 'var(--text-muted)', marginLeft: '8px' }}>{tokens} tokens</span>
+                </div>
+            );
+        });
+
+        const HookRow = memo(function HookRow({ event, fired, errors, rate }) {
+            return (
+                <tr>
+                    <td>{event}</td>
+                    <td>{fired}</td>
+                    <td style={errorCountStyle(errors)}>{errors}</td>
+                    <td>{rate !== null ? `${rate.toFixed(0)}%` : '-'}</td>
+                </tr>
+            );
+        });
+
+        const renderRuleItem = (source, i) => <RuleItem key={i} name={source.name} tokens={source.tokens} lines={source.lines} />;
+        const renderTokenItem = (item, i) => <TokenItem key={i} name={item.name} tokens={item.tokens} />;
+
+        // Stack Page
+        const StackPage = memo(function StackPage({ data }) {
+            // Format the headline numbers only when their values change
+            const totalTokens = data && data.total_tokens;
+            const efficiency = data && data.hooks.efficiency;
+            const totalTokensStr = useMemo(() => totalTokens == null ? '' : formatNumber(totalTokens), [totalTokens]);
+            const efficiencyStr = useMemo(() => efficiency == null ? '' : efficiency.toFixed(1) + '%', [efficiency]);
 
             if (!data) return <div className="loading"><div className="spinner" />Loading...</div>;
 
@@ -2249,7 +2867,7 @@ def get_embedded_frontend() -> str:
                     {/* Token Summary */}
                     <div className="grid grid-4">
                         <div className="card metric-card">
-                            <div className="metric-value">{data.total_tokens.toLocaleString()}</div>
+                            <div className="metric-value">{totalTokensStr}</div>
                             <div className="metric-label">Total Tokens</div>
                         </div>
                         <div className="card metric-card">
@@ -2257,7 +2875,7 @@ def get_embedded_frontend() -> str:
                             <div className="metric-label">Components</div>
                         </div>
                         <div className="card metric-card">
-                            <div className="metric-value">{data.hooks.efficiency.toFixed(1)}%</div>
+                            <div className="metric-value">{efficiencyStr}</div>
                             <div className="metric-label">Hook Efficiency</div>
                         </div>
                         <div className="card metric-card">
@@ -2277,14 +2895,11 @@ def get_embedded_frontend() -> str:
                                 </span>
                             </div>
                             <div className="card-body">
-                                {data.rules.sources.map((source, i) => (
-                                    <div key={i} style={{ marginBottom: '12px' }}>
-                                        <div style={{ fontWeight: '500', marginBottom: '4px' }}>{source.name}</div>
-                                        <div style={{ fontSize: '11px', color: 'var(--text-secondary)' }}>
-                                            {source.tokens} tokens • {source.lines} lines
-                                        </div>
-                                    </div>
-                                ))}
+                                <StackList
+                                    items={data.rules.sources}
+                                    describe={describeRule}
+                                    renderItem={renderRuleItem}
+                                />
                             </div>
                         </div>
 
@@ -2306,13 +2921,8 @@ def get_embedded_frontend() -> str:
                                     </tr>
                                 </thead>
                                 <tbody>
-                                    {data.hooks.hooks.filter(h => h.fired > 0).map(hook => (
-                                        <tr key={hook.event}>
-                                            <td>{hook.event}</td>
-                                            <td>{hook.fired}</td>
-                                            <td style={{ color: hook.errors > 0 ? 'var(--error)' : 'inherit' }}>{hook.errors}</td>
-                                            <td>{hook.rate !== null ? `${hook.rate.toFixed(0)}%` : '-'}</td>
-                                        </tr>
+                                    {data.hooks.hooks.map(hook => (
+                                        <HookRow key={hook.event} event={hook.event} fired={hook.fired} errors={hook.errors} rate={hook.rate} />
                                     ))}
                                 </tbody>
                             </table>
@@ -2332,12 +2942,11 @@ def get_embedded_frontend() -> str:
                                 {data.skills.skills.length === 0 ? (
                                     <p style={{ color: 'var(--text-muted)' }}>No skills configured</p>
                                 ) : (
-                                    data.skills.skills.map((skill, i) => (
-                                        <div key={i} style={{ marginBottom: '8px' }}>
-                                            <span style={{ fontWeight: '500' }}>{skill.name}</span>
-                                            <span style={{ color: 'var(--text-muted)', marginLeft: '8px' }}>{skill.tokens} tokens</span>
-                                        </div>
-                                    ))
+                                    <StackList
+                                        items={data.skills.skills}
+                                        describe={describeTokens}
+                                        renderItem={renderTokenItem}
+                                    />
                                 )}
                             </div>
                         </div>
@@ -2352,75 +2961,62 @@ def get_embedded_frontend() -> str:
                                 {data.agents.agents.length === 0 ? (
                                     <p style={{ color: 'var(--text-muted)' }}>No agents configured</p>
                                 ) : (
-                                    data.agents.agents.map((agent, i) => (
-                                        <div key={i} style={{ marginBottom: '8px' }}>
-                                            <span style={{ fontWeight: '500' }}>{agent.name}</span>
-                                            <span style={{ color: 'var(--text-muted)', marginLeft: '8px' }}>{agent.tokens} tokens</span>
-                                        </div>
-                                    ))
+                                    <StackList
+                                        items={data.agents.agents}
+                                        describe={describeTokens}
+                                        renderItem={renderTokenItem}
+                                    />
                                 )}
                             </div>
                         </div>
                     </div>
                 </div>
             );
-        }
+        });
+
+        // Header navigation entries; module-level so the nav map sees the same objects every render
+        const PAGES = Object.freeze([
+            { id: 'overview', label: 'Overview' },
+            { id: 'tools', label: 'Tools' },
+            { id: 'timeline', label: 'Timeline' },
+            { id: 'alerts', label: 'Alerts' },
+            { id: 'stack', label: 'Stack' }
+        ]);
+
+        // Nav button - theme and menu toggles leave it untouched
+        const NavItem = memo(function NavItem({ p, active, onNav }) {
+            return (
+                <button className={`nav-item ${active ? 'active' : ''}`} onClick={() => onNav(p.id)}>
+                    {p.label}
+                </button>
+            );
+        });
 
         // Main App
         function App() {
             const [page, setPage] = useState('overview');
             const [darkMode, setDarkMode] = useState(false);
-            const [data, setData] = useState({});
-            const [loading, setLoading] = useState(true);
             const [menuOpen, setMenuOpen] = useState(false);
             const [expandedAlerts, setExpandedAlerts] = useState({});
 
-            const fetchData = useCallback(async () => {
-                try {
-                    const endpoints = {
-                        overview: '/api/overview',
-                        tools: '/api/tools',
-                        timeline: '/api/timeline',
-                        alerts: '/api/alerts',
-                        stack: '/api/stack'
-                    };
-                    // Always fetch overview for live status indicator
-                    const [pageResult, overviewResult] = await Promise.all([
-                        api.fetch(endpoints[page]),
-                        page !== 'overview' ? api.fetch('/api/overview') : Promise.resolve(null)
-                    ]);
-                    setData(prev => ({
-                        ...prev,
-                        [page]: pageResult,
-                        ...(overviewResult && { overview: overviewResult })
-                    }));
-                    setLoading(false);
-                } catch (err) {
-                    console.error('API Error:', err);
-                    setLoading(false);
-                }
-            }, [page]);
+            // Each selector reads a single value, so App re-renders only when it changes
+            const pageData = useSyncExternalStore(store.subscribe, useCallback(() => store.state[page], [page]));
+            const isActive = useSyncExternalStore(store.subscribe, selectIsActive);
 
-            useEffect(() => {
-                fetchData();
-                const interval = setInterval(fetchData, 2000);
-                return () => clearInterval(interval);
-            }, [fetchData]);
+            useEffect(() => store.setPage(page), [page]);
 
             useEffect(() => {
                 document.documentElement.classList.toggle('dark', darkMode);
             }, [darkMode]);
 
-            const pages = [
-                { id: 'overview', label: 'Overview' },
-                { id: 'tools', label: 'Tools' },
-                { id: 'timeline', label: 'Timeline' },
-                { id: 'alerts', label: 'Alerts' },
-                { id: 'stack', label: 'Stack' }
-            ];
+            const handleNav = useCallback((id) => {
+                setPage(id);
+                setMenuOpen(false);
+            }, []);
+            const toggleDarkMode = useCallback(() => setDarkMode(d => !d), []);
+            const toggleMenu = useCallback(() => setMenuOpen(open => !open), []);
 
             const renderPage = () => {
-                const pageData = data[page];
                 switch (page) {
                     case 'overview': return <OverviewPage data={pageData} />;
                     case 'tools': return <ToolsPage data={pageData} />;
@@ -2440,32 +3036,26 @@ def get_embedded_frontend() -> str:
                         </div>
 
                         <nav className={`nav ${menuOpen ? "open" : ""}`}>
-                            {pages.map(p => (
-                                <button
-                                    key={p.id}
-                                    className={`nav-item ${page === p.id ? 'active' : ''}`}
-                                    onClick={() => { setPage(p.id); setMenuOpen(false); }}
-                                >
-                                    {p.label}
-                                </button>
+                            {PAGES.map(p => (
+                                <NavItem key={p.id} p={p} active={page === p.id} onNav={handleNav} />
                             ))}
                         </nav>
 
                         <div className="header-actions">
-                            <div className={`live-indicator ${data?.overview?.session?.is_active ? '' : 'offline'}`}>
+                            <div className={`live-indicator ${isActive ? '' : 'offline'}`}>
                                 <div className="live-dot" />
-                                {data?.overview?.session?.is_active ? 'Live' : 'Offline'}
+                                {isActive ? 'Live' : 'Offline'}
                             </div>
                             <button
                                 className="theme-toggle"
-                                onClick={() => setDarkMode(!darkMode)}
+                                onClick={toggleDarkMode}
                                 title={darkMode ? 'Switch to light mode' : 'Switch to dark mode'}
                             >
                                 {darkMode ? <Icons.Sun /> : <Icons.Moon />}
                             </button>
                             <button
                                 className="menu-toggle"
-                                onClick={() => setMenuOpen(!menuOpen)}
+                                onClick={toggleMenu}
                                 title="Toggle menu"
                             >
                                 {menuOpen ? <Icons.Close /> : <Icons.Menu />}
@@ -2485,7 +3075,87 @@ def get_embedded_frontend() -> str:
         }
 
         ReactDOM.createRoot(document.getElementById('root')).render(<App />);
+'''
+
+
+def compile_frontend_app(source: str) -> Optional[str]:
+    """Precompile the JSX app to plain JavaScript with esbuild.
+
+    Returns None when esbuild is not installed or the build fails; the page
+    then falls back to transpiling in the browser with Babel Standalone.
+    """
+    esbuild = shutil.which("esbuild")
+    if not esbuild:
+        return None
+
+    try:
+        result = subprocess.run(
+            [esbuild, "--loader=jsx", "--format=iife", "--minify", "--target=es2018"],
+            input=source,
+            capture_output=True,
+            text=True,
+            timeout=30,
+            check=True
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    return result.stdout
+
+
+# UI runtimes the app can mount on. Preact's compat layer exposes the React
+# API the app uses under the same globals at a fraction of the download size.
+RUNTIME_SCRIPTS = {
+    "react": '''    <script src="https://unpkg.com/react@18/umd/react.production.min.js" crossorigin></script>
+    <script src="https://unpkg.com/react-dom@18/umd/react-dom.production.min.js" crossorigin></script>
+''',
+    "preact": '''    <script src="https://unpkg.com/preact@10/dist/preact.umd.js" crossorigin></script>
+    <script src="https://unpkg.com/preact@10/hooks/dist/hooks.umd.js" crossorigin></script>
+    <script src="https://unpkg.com/preact@10/compat/dist/compat.umd.js" crossorigin></script>
+    <script>
+        window.React = window.ReactDOM = preactCompat;
+        if (!preactCompat.createRoot) {
+            preactCompat.createRoot = function (el) {
+                return { render: function (vnode) { preactCompat.render(vnode, el); } };
+            };
+        }
     </script>
+''',
+}
+
+
+def get_embedded_frontend(precompiled: bool = False, runtime: str = "react") -> str:
+    """Return the embedded React frontend HTML page.
+
+    The page expects /dashboard.css (get_deferred_styles) next to it.
+
+    With precompiled=True the page loads /dashboard.js (built by
+    compile_frontend_app) instead of shipping Babel Standalone and the JSX.
+    runtime selects the UI library from RUNTIME_SCRIPTS.
+    """
+    if precompiled:
+        babel_tag = ""
+        app_tag = '    <script src="/dashboard.js"></script>'
+    else:
+        babel_tag = '    <script src="https://unpkg.com/@babel/standalone/babel.min.js"></script>\n'
+        app_tag = '    <script type="text/babel">' + get_frontend_app() + '    </script>'
+
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>ctx-monitor Dashboard</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&family=JetBrains+Mono:wght@400;500;600;700&display=swap" rel="stylesheet">
+{RUNTIME_SCRIPTS[runtime]}{babel_tag}    <style>{get_critical_styles()}    </style>
+    <link rel="preload" href="/dashboard.css" as="style" onload="this.onload=null;this.rel='stylesheet'">
+    <noscript><link rel="stylesheet" href="/dashboard.css"></noscript>
+</head>
+<body>
+    <div id="root"></div>
+{app_tag}
 </body>
 </html>'''
 
@@ -2494,19 +3164,26 @@ def get_embedded_frontend() -> str:
 # MAIN SERVER
 # =============================================================================
 
-def create_temp_frontend_dir() -> Path:
+def create_temp_frontend_dir(runtime: str = "react") -> Path:
     """Create temporary directory with frontend files."""
     import tempfile
     temp_dir = Path(tempfile.mkdtemp(prefix="ctx-monitor-"))
 
+    # Precompile the app when esbuild is available, else let the browser transpile
+    compiled = compile_frontend_app(get_frontend_app())
+    if compiled:
+        (temp_dir / "dashboard.js").write_text(compiled)
+
+    (temp_dir / "dashboard.css").write_text(get_deferred_styles())
+
     # Write index.html
     index_file = temp_dir / "index.html"
-    index_file.write_text(get_embedded_frontend())
+    index_file.write_text(get_embedded_frontend(precompiled=compiled is not None, runtime=runtime))
 
     return temp_dir
 
 
-def run_server(project_dir: str, port: int = DEFAULT_PORT, no_open: bool = False):
+def run_server(project_dir: str, port: int = DEFAULT_PORT, no_open: bool = False, runtime: str = "react"):
     """Run the dashboard server."""
     project_path = Path(project_dir).resolve()
 
@@ -2518,7 +3195,7 @@ def run_server(project_dir: str, port: int = DEFAULT_PORT, no_open: bool = False
     api = DashboardAPI(project_path)
 
     # Create temp frontend directory
-    frontend_dir = create_temp_frontend_dir()
+    frontend_dir = create_temp_frontend_dir(runtime)
 
     # Configure handler
     DashboardHTTPHandler.api = api
@@ -2538,7 +3215,6 @@ def run_server(project_dir: str, port: int = DEFAULT_PORT, no_open: bool = False
         watcher.stop()
         server.shutdown()
         # Cleanup temp dir
-        import shutil
         shutil.rmtree(frontend_dir, ignore_errors=True)
         sys.exit(0)
 
@@ -2584,9 +3260,15 @@ def main():
         action="store_true",
         help="Don't open browser automatically"
     )
+    parser.add_argument(
+        "--runtime",
+        choices=sorted(RUNTIME_SCRIPTS),
+        default="react",
+        help="UI runtime for the dashboard (default: react)"
+    )
 
     args = parser.parse_args()
-    run_server(args.project_dir, args.port, args.no_open)
+    run_server(args.project_dir, args.port, args.no_open, args.runtime)
 
 
 if __name__ == "__main__":
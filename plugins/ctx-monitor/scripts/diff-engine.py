@@ -3,79 +3,296 @@
 diff-engine.py - Compare traces between executions to identify regressions
 
 Usage:
-    python diff-engine.py <session1.jsonl> <session2.jsonl> [--format json|text|md]
-    python diff-engine.py --traces-dir <dir> --last 2 [--format json|text|md]
+    python diff-engine.py <session1.jsonl> <session2.jsonl> [--format json|text|md] [--deep-diff]
+    python diff-engine.py --traces-dir <dir> --last 2 [--format json|text|md] [--deep-diff]
 """
 
 import json
+import math
+import mmap
+import os
+import stat
 import sys
 import argparse
+import io
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Any
-from collections import defaultdict
-
-
-def load_trace(file_path: str) -> List[Dict[str, Any]]:
-    """Load events from a JSONL trace file."""
-    events = []
-    with open(file_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError:
-                    pass
-    return events
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Sequence, Tuple
+from collections import Counter
+
+# orjson parses trace lines several times faster; the stdlib parser is the fallback
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+TRACE_READ_SIZE = 1 << 20  # Bytes read per block when a trace can't be memory-mapped
+MAX_SEQUENCE_ANOMALIES = 50  # Insert/delete ops listed by --deep-diff
+MAX_REPORTED_BAD_LINES = 5  # Line numbers named in the malformed-line warning
+PARALLEL_MIN_BYTES = 8 << 20  # Combined trace size from which the two analyses run in parallel
+
+
+def _mapped_lines(mm: mmap.mmap) -> Iterator[bytes]:
+    """Yield the lines of a memory-mapped file, finding newlines in place."""
+    find = mm.find
+    size = len(mm)
+    start = 0
+    while start < size:
+        end = find(b"\n", start)
+        if end < 0:
+            end = size
+        yield mm[start:end]
+        start = end + 1
+
+
+def _block_lines(f: BinaryIO) -> Iterator[bytes]:
+    """Yield the lines of a stream read in large blocks; works on pipes and FIFOs."""
+    tail = b""
+    while True:
+        chunk = f.read(TRACE_READ_SIZE)
+        lines = (tail + chunk).split(b"\n")
+        # Keep the incomplete last line for the next block; at EOF yield everything
+        tail = lines.pop() if chunk else b""
+        yield from lines
+        if not chunk:
+            break
+
+
+def iter_trace(file_path: str) -> Iterator[Dict[str, Any]]:
+    """Yield events from a JSONL trace file.
+
+    Regular files are memory-mapped; pipes, FIFOs and anything mmap refuses
+    are read in large blocks instead. Malformed lines are skipped and
+    reported once on stderr when the file has been consumed.
+    """
+    bad_count = 0
+    bad_lines: List[int] = []
+
+    with open(file_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        mm = None
+        # Non-regular files report size 0, and mmap refuses zero-length mappings
+        if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                mm = None
+        try:
+            for line_no, line in enumerate(_mapped_lines(mm) if mm is not None else _block_lines(f), 1):
+                if line and not line.isspace():
+                    try:
+                        yield json_loads(line)
+                    except ValueError:
+                        bad_count += 1
+                        if len(bad_lines) < MAX_REPORTED_BAD_LINES:
+                            bad_lines.append(line_no)
+        finally:
+            if mm is not None:
+                mm.close()
+
+    if bad_count:
+        print(f"Warning: skipped {bad_count} malformed line(s) in {file_path} "
+              f"(at line {', '.join(map(str, bad_lines))}{', ...' if bad_count > len(bad_lines) else ''})",
+              file=sys.stderr)
+
+
+def analyze_trace(events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Analyze a trace and extract key metrics.
+
+    events may be any iterable, so a trace can be analyzed straight from
+    iter_trace without holding every event in memory.
+    """
+    call_counts = Counter()
+    error_counts = Counter()
+    # Tool name per event (None for non-tool events); the only sequence compare_traces reads
+    seq_tools = []
+    session_id = None
+    total_events = 0
+    # (event_type, tool_name) -> interned (signature, tool name). Repeats within a trace
+    # share one string object; across traces, identity only holds when both were analyzed
+    # in this process, since results unpickled from analyze_pair's worker are not interned
+    signatures: Dict[tuple, tuple] = {}
 
+    for event in events:
+        if not total_events:
+            session_id = event.get("session_id")
+        total_events += 1
+        event_type = event.get("event_type", "unknown")
+        tool_name = event.get("tool_name")
+        if tool_name:
+            pair = (event_type, tool_name)
+            interned = signatures.get(pair)
+            if interned is None:
+                interned = signatures[pair] = (
+                    sys.intern(f"{event_type}:{tool_name}"),
+                    sys.intern(str(tool_name))
+                )
+            key, tool_name = interned
+            call_counts[key] += 1
 
-def get_tool_signature(event: Dict[str, Any]) -> str:
-    """Generate a signature for a tool call."""
-    tool_name = event.get("tool_name", "unknown")
-    event_type = event.get("event_type", "unknown")
-    return f"{event_type}:{tool_name}"
+            if event.get("status") == "error":
+                error_counts[key] += 1
 
+        seq_tools.append(tool_name)
 
-def analyze_trace(events: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Analyze a trace and extract key metrics."""
-    tool_calls = defaultdict(lambda: {"count": 0, "errors": 0, "statuses": []})
-    event_sequence = []
-    errors = []
+    # Tools that errored at least once, derived per distinct signature rather than per error
+    error_tools = frozenset(tool for key, tool in signatures.values() if key in error_counts)
 
-    for event in events:
-        event_type = event.get("event_type", "unknown")
-        tool_name = event.get("tool_name")
-        status = event.get("status")
+    # The Counters are returned as-is; missing keys read as 0, so no per-tool dicts are built
+    return {
+        "tool_set": frozenset(call_counts),
+        "call_counts": call_counts,
+        "error_counts": error_counts,
+        "seq_tools": seq_tools,
+        "tool_sequence_length": sum(call_counts.values()),
+        "session_id": session_id,
+        "total_events": total_events,
+        "error_tools": error_tools,
+        "error_count": sum(error_counts.values())
+    }
 
-        if tool_name:
-            key = f"{event_type}:{tool_name}"
-            tool_calls[key]["count"] += 1
-            tool_calls[key]["statuses"].append(status)
-
-            if status == "error":
-                tool_calls[key]["errors"] += 1
-                errors.append({
-                    "tool": tool_name,
-                    "error": event.get("error_message", "Unknown")
-                })
-
-        event_sequence.append({
-            "type": event_type,
-            "tool": tool_name,
-            "status": status
-        })
 
+def analyze_file(file_path: str) -> Dict[str, Any]:
+    """Parse and analyze a JSONL trace in a single pass.
+
+    Each event is folded into the counters as soon as it is parsed and
+    then dropped, so memory stays proportional to the analysis result
+    rather than to the trace size.
+    """
+    return analyze_trace(iter_trace(file_path))
+
+
+def analyze_pair(file1: str, file2: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Analyze two trace files, overlapping them on multi-core machines.
+
+    Parsing holds the GIL (orjson included), so threads would not overlap;
+    the first trace goes to a worker process instead. That costs a process
+    start and a pickled result, so small traces are analyzed serially.
+    """
+    if (os.cpu_count() or 1) > 1 and os.path.getsize(file1) + os.path.getsize(file2) >= PARALLEL_MIN_BYTES:
+        trace2 = None
+        try:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                future = pool.submit(analyze_file, file1)
+                trace2 = analyze_file(file2)
+                return future.result(), trace2
+        except (OSError, BrokenProcessPool, NotImplementedError, ImportError):
+            # No usable process support (sandboxed, no sem_open, worker died); fall back
+            # to serial, keeping the second trace if it was already analyzed here
+            if trace2 is not None:
+                return analyze_file(file1), trace2
+    return analyze_file(file1), analyze_file(file2)
+
+
+def symbolize(seq1: Sequence[str], seq2: Sequence[str]) -> Tuple[array, array, List[str]]:
+    """Map tool names to small ints shared by both sequences."""
+    symbol_map: Dict[str, int] = {}
+    a = array('I', [symbol_map.setdefault(tool, len(symbol_map)) for tool in seq1])
+    b = array('I', [symbol_map.setdefault(tool, len(symbol_map)) for tool in seq2])
+    return a, b, list(symbol_map)
+
+
+def _lcs_fill(a, b, table):
+    """Fill a zeroed (len(a)+1) x (len(b)+1) numpy table in place; compiled by Numba."""
+    for i in range(a.shape[0]):
+        x = a[i]
+        for j in range(b.shape[0]):
+            if x == b[j]:
+                table[i + 1, j + 1] = table[i, j] + 1
+            elif table[i, j + 1] > table[i + 1, j]:
+                table[i + 1, j + 1] = table[i, j + 1]
+            else:
+                table[i + 1, j + 1] = table[i + 1, j]
+
+
+_lcs_kernel = None  # Compiled _lcs_fill; False once numba is known to be unavailable
+
+
+def _get_lcs_kernel():
+    """Compile _lcs_fill with Numba on first use; numba is optional and slow to import."""
+    global _lcs_kernel
+    if _lcs_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _lcs_kernel = False
+        else:
+            _lcs_kernel = njit(cache=True)(_lcs_fill)
+    return _lcs_kernel
+
+
+def lcs_table(a: Sequence[int], b: Sequence[int]):
+    """Build the O(len(a) * len(b)) LCS table; table[i][j] covers a[:i] and b[:j].
+
+    Uses the Numba kernel on numpy arrays when numba is installed, and a
+    pure-Python DP over array('I') rows otherwise.
+    """
+    kernel = _get_lcs_kernel()
+    if kernel:
+        import numpy as np
+        table = np.zeros((len(a) + 1, len(b) + 1), dtype=np.int32)
+        kernel(np.asarray(a), np.asarray(b), table)
+        return table
+
+    width = len(b) + 1
+    table = [array('I', [0]) * width]
+    for x in a:
+        prev = table[-1]
+        row = array('I', [0]) * width
+        best = 0
+        for j, y in enumerate(b):
+            if x == y:
+                best = prev[j] + 1
+            elif prev[j + 1] > best:
+                best = prev[j + 1]
+            row[j + 1] = best
+        table.append(row)
+    return table
+
+
+def sequence_diff(seq1: Sequence[str], seq2: Sequence[str]) -> Dict[str, Any]:
+    """Quantify how two tool sequences differ using their longest common subsequence.
+
+    nlcs is the LCS length normalized by sqrt(len1 * len2): 1.0 for identical
+    sequences, 0.0 when they share nothing. Anomalies are the tool calls outside
+    the LCS: deletions index into seq1, insertions into seq2.
+    """
+    a, b, names = symbolize(seq1, seq2)
+    table = lcs_table(a, b)
+
+    ops = []
+    i, j = len(a), len(b)
+    while i > 0 or j > 0:
+        if i > 0 and j > 0 and a[i - 1] == b[j - 1]:
+            i -= 1
+            j -= 1
+        elif j == 0 or (i > 0 and table[i - 1][j] >= table[i][j - 1]):
+            i -= 1
+            ops.append({"op": "delete", "index": i, "tool": names[a[i]]})
+        else:
+            j -= 1
+            ops.append({"op": "insert", "index": j, "tool": names[b[j]]})
+    ops.reverse()
+
+    lcs_length = int(table[-1][-1])
+    deletions = sum(1 for op in ops if op["op"] == "delete")
     return {
-        "tool_calls": dict(tool_calls),
-        "event_sequence": event_sequence,
-        "total_events": len(events),
-        "errors": errors,
-        "error_count": len(errors)
+        "lcs_length": lcs_length,
+        "nlcs": round(lcs_length / math.sqrt(len(a) * len(b)), 4) if a and b else 0.0,
+        "deletions": deletions,
+        "insertions": len(ops) - deletions,
+        "anomalies": ops[:MAX_SEQUENCE_ANOMALIES]
     }
 
 
-def compare_traces(trace1: Dict[str, Any], trace2: Dict[str, Any]) -> Dict[str, Any]:
-    """Compare two analyzed traces and identify differences."""
+def compare_traces(trace1: Dict[str, Any], trace2: Dict[str, Any], deep: bool = False) -> Dict[str, Any]:
+    """Compare two analyzed traces and identify differences.
+
+    With deep=True a differing tool sequence is also scored with an LCS
+    (see sequence_diff); this is quadratic in the sequence lengths.
+    """
     diff = {
         "added_tools": [],
         "removed_tools": [],
@@ -85,27 +302,33 @@ def compare_traces(trace1: Dict[str, Any], trace2: Dict[str, Any]) -> Dict[str,
         "summary": {}
     }
 
-    tools1 = set(trace1.get("tool_calls", {}).keys())
-    tools2 = set(trace2.get("tool_calls", {}).keys())
+    calls1 = trace1.get("call_counts", Counter())
+    calls2 = trace2.get("call_counts", Counter())
+    errs1 = trace1.get("error_counts", Counter())
+    errs2 = trace2.get("error_counts", Counter())
+    tools1 = trace1.get("tool_set", frozenset())
+    tools2 = trace2.get("tool_set", frozenset())
 
+    # Tool lists are sorted so the output is deterministic and diffable across runs
     # Added tools
-    diff["added_tools"] = list(tools2 - tools1)
+    diff["added_tools"] = sorted(tools2 - tools1)
 
     # Removed tools
-    diff["removed_tools"] = list(tools1 - tools2)
+    diff["removed_tools"] = sorted(tools1 - tools2)
 
     # Changed tools (count or error rate)
+    # A tool erroring more often is a regression; flagged here rather than re-scanning changed_tools
+    error_regression = False
     common_tools = tools1 & tools2
-    for tool in common_tools:
-        stats1 = trace1["tool_calls"][tool]
-        stats2 = trace2["tool_calls"][tool]
-
+    for tool in sorted(common_tools):
         changes = {}
-        if stats1["count"] != stats2["count"]:
-            changes["count"] = {"from": stats1["count"], "to": stats2["count"]}
+        if calls1[tool] != calls2[tool]:
+            changes["count"] = {"from": calls1[tool], "to": calls2[tool]}
 
-        if stats1["errors"] != stats2["errors"]:
-            changes["errors"] = {"from": stats1["errors"], "to": stats2["errors"]}
+        if errs1[tool] != errs2[tool]:
+            changes["errors"] = {"from": errs1[tool], "to": errs2[tool]}
+            if errs2[tool] > errs1[tool]:
+                error_regression = True
 
         if changes:
             diff["changed_tools"].append({
@@ -114,8 +337,8 @@ def compare_traces(trace1: Dict[str, Any], trace2: Dict[str, Any]) -> Dict[str,
             })
 
     # Error changes
-    errors1 = set(e["tool"] for e in trace1.get("errors", []))
-    errors2 = set(e["tool"] for e in trace2.get("errors", []))
+    errors1 = trace1.get("error_tools", frozenset())
+    errors2 = trace2.get("error_tools", frozenset())
 
     new_errors = errors2 - errors1
     resolved_errors = errors1 - errors2
@@ -123,25 +346,34 @@ def compare_traces(trace1: Dict[str, Any], trace2: Dict[str, Any]) -> Dict[str,
     if new_errors:
         diff["error_changes"].append({
             "type": "new_errors",
-            "tools": list(new_errors)
+            "tools": sorted(new_errors)
         })
 
     if resolved_errors:
         diff["error_changes"].append({
             "type": "resolved_errors",
-            "tools": list(resolved_errors)
+            "tools": sorted(resolved_errors)
         })
 
-    # Sequence analysis (simplified)
-    seq1 = [e["tool"] for e in trace1.get("event_sequence", []) if e["tool"]]
-    seq2 = [e["tool"] for e in trace2.get("event_sequence", []) if e["tool"]]
+    # Sequence analysis (simplified): lengths are known up front, so only
+    # equal-length sequences are walked, and only up to the first mismatch
+    len1 = trace1.get("tool_sequence_length", 0)
+    len2 = trace2.get("tool_sequence_length", 0)
+    seq1 = filter(None, trace1.get("seq_tools", []))
+    seq2 = filter(None, trace2.get("seq_tools", []))
 
-    if seq1 != seq2:
-        diff["sequence_changes"].append({
+    if len1 != len2 or any(a != b for a, b in zip(seq1, seq2)):
+        change = {
             "description": "Tool call sequence differs",
-            "trace1_length": len(seq1),
-            "trace2_length": len(seq2)
-        })
+            "trace1_length": len1,
+            "trace2_length": len2
+        }
+        if deep:
+            change.update(sequence_diff(
+                [tool for tool in trace1.get("seq_tools", []) if tool],
+                [tool for tool in trace2.get("seq_tools", []) if tool]
+            ))
+        diff["sequence_changes"].append(change)
 
     # Summary
     diff["summary"] = {
@@ -150,11 +382,7 @@ def compare_traces(trace1: Dict[str, Any], trace2: Dict[str, Any]) -> Dict[str,
         "changed_count": len(diff["changed_tools"]),
         "new_errors_count": len(new_errors),
         "resolved_errors_count": len(resolved_errors),
-        "has_regressions": len(new_errors) > 0 or any(
-            c.get("changes", {}).get("errors", {}).get("to", 0) >
-            c.get("changes", {}).get("errors", {}).get("from", 0)
-            for c in diff["changed_tools"]
-        )
+        "has_regressions": bool(new_errors) or error_regression
     }
 
     return diff
@@ -162,111 +390,136 @@ def compare_traces(trace1: Dict[str, Any], trace2: Dict[str, Any]) -> Dict[str,
 
 def format_diff_text(diff: Dict[str, Any], session1_id: str, session2_id: str) -> str:
     """Format diff as plain text."""
-    lines = []
-    lines.append("=" * 60)
-    lines.append("CTX-MONITOR TRACE DIFF")
-    lines.append("=" * 60)
-    lines.append(f"\nComparing: {session1_id} -> {session2_id}")
+    buf = io.StringIO()
+    w = buf.write
+    w("=" * 60)
+    w("\nCTX-MONITOR TRACE DIFF")
+    w("\n" + "=" * 60)
+    w(f"\n\nComparing: {session1_id} -> {session2_id}")
 
     summary = diff.get("summary", {})
-    lines.append("\nSummary:")
-    lines.append(f"  - Added tools: {summary.get('added_count', 0)}")
-    lines.append(f"  - Removed tools: {summary.get('removed_count', 0)}")
-    lines.append(f"  - Changed tools: {summary.get('changed_count', 0)}")
-    lines.append(f"  - New errors: {summary.get('new_errors_count', 0)}")
-    lines.append(f"  - Resolved errors: {summary.get('resolved_errors_count', 0)}")
+    w("\n\nSummary:")
+    w(f"\n  - Added tools: {summary.get('added_count', 0)}")
+    w(f"\n  - Removed tools: {summary.get('removed_count', 0)}")
+    w(f"\n  - Changed tools: {summary.get('changed_count', 0)}")
+    w(f"\n  - New errors: {summary.get('new_errors_count', 0)}")
+    w(f"\n  - Resolved errors: {summary.get('resolved_errors_count', 0)}")
 
     if summary.get("has_regressions"):
-        lines.append("\n  ⚠️  REGRESSIONS DETECTED")
+        w("\n\n  ⚠️  REGRESSIONS DETECTED")
 
     if diff.get("added_tools"):
-        lines.append("\n+ Added Tools:")
+        w("\n\n+ Added Tools:")
         for tool in diff["added_tools"]:
-            lines.append(f"    + {tool}")
+            w(f"\n    + {tool}")
 
     if diff.get("removed_tools"):
-        lines.append("\n- Removed Tools:")
+        w("\n\n- Removed Tools:")
         for tool in diff["removed_tools"]:
-            lines.append(f"    - {tool}")
+            w(f"\n    - {tool}")
 
     if diff.get("changed_tools"):
-        lines.append("\n~ Changed Tools:")
+        w("\n\n~ Changed Tools:")
         for change in diff["changed_tools"]:
             tool = change["tool"]
             changes = change["changes"]
-            lines.append(f"    ~ {tool}:")
+            w(f"\n    ~ {tool}:")
             for key, val in changes.items():
-                lines.append(f"        {key}: {val['from']} -> {val['to']}")
+                w(f"\n        {key}: {val['from']} -> {val['to']}")
 
     if diff.get("error_changes"):
-        lines.append("\n! Error Changes:")
+        w("\n\n! Error Changes:")
         for ec in diff["error_changes"]:
             if ec["type"] == "new_errors":
-                lines.append(f"    NEW ERRORS: {', '.join(ec['tools'])}")
+                w(f"\n    NEW ERRORS: {', '.join(ec['tools'])}")
             else:
-                lines.append(f"    RESOLVED: {', '.join(ec['tools'])}")
+                w(f"\n    RESOLVED: {', '.join(ec['tools'])}")
+
+    for sc in diff.get("sequence_changes", []):
+        if "nlcs" in sc:
+            w("\n\n# Sequence Changes:")
+            w(f"\n    nLCS: {sc['nlcs']} ({sc['lcs_length']} common calls)")
+            w(f"\n    Inserted: {sc['insertions']}, Deleted: {sc['deletions']}")
+            for op in sc["anomalies"]:
+                mark = "+" if op["op"] == "insert" else "-"
+                w(f"\n    {mark} #{op['index']} {op['tool']}")
 
-    lines.append("\n" + "=" * 60)
-    return "\n".join(lines)
+    w("\n\n" + "=" * 60)
+    return buf.getvalue()
 
 
 def format_diff_markdown(diff: Dict[str, Any], session1_id: str, session2_id: str) -> str:
     """Format diff as Markdown."""
-    lines = []
-    lines.append("# CTX-Monitor Trace Diff\n")
-    lines.append(f"**Comparing:** `{session1_id}` → `{session2_id}`\n")
+    buf = io.StringIO()
+    w = buf.write
+    w("# CTX-Monitor Trace Diff\n")
+    w(f"\n**Comparing:** `{session1_id}` → `{session2_id}`\n")
 
     summary = diff.get("summary", {})
 
     if summary.get("has_regressions"):
-        lines.append("> ⚠️ **REGRESSIONS DETECTED**\n")
+        w("\n> ⚠️ **REGRESSIONS DETECTED**\n")
 
-    lines.append("## Summary\n")
-    lines.append("| Metric | Count |")
-    lines.append("|--------|-------|")
-    lines.append(f"| Added tools | {summary.get('added_count', 0)} |")
-    lines.append(f"| Removed tools | {summary.get('removed_count', 0)} |")
-    lines.append(f"| Changed tools | {summary.get('changed_count', 0)} |")
-    lines.append(f"| New errors | {summary.get('new_errors_count', 0)} |")
-    lines.append(f"| Resolved errors | {summary.get('resolved_errors_count', 0)} |")
+    w("\n## Summary\n")
+    w("\n| Metric | Count |")
+    w("\n|--------|-------|")
+    w(f"\n| Added tools | {summary.get('added_count', 0)} |")
+    w(f"\n| Removed tools | {summary.get('removed_count', 0)} |")
+    w(f"\n| Changed tools | {summary.get('changed_count', 0)} |")
+    w(f"\n| New errors | {summary.get('new_errors_count', 0)} |")
+    w(f"\n| Resolved errors | {summary.get('resolved_errors_count', 0)} |")
 
     if diff.get("added_tools"):
-        lines.append("\n## Added Tools\n")
+        w("\n\n## Added Tools\n")
         for tool in diff["added_tools"]:
-            lines.append(f"- ➕ `{tool}`")
+            w(f"\n- ➕ `{tool}`")
 
     if diff.get("removed_tools"):
-        lines.append("\n## Removed Tools\n")
+        w("\n\n## Removed Tools\n")
         for tool in diff["removed_tools"]:
-            lines.append(f"- ➖ `{tool}`")
+            w(f"\n- ➖ `{tool}`")
 
     if diff.get("changed_tools"):
-        lines.append("\n## Changed Tools\n")
+        w("\n\n## Changed Tools\n")
         for change in diff["changed_tools"]:
-            lines.append(f"\n### `{change['tool']}`")
+            w(f"\n\n### `{change['tool']}`")
             for key, val in change["changes"].items():
-                lines.append(f"- **{key}:** {val['from']} → {val['to']}")
+                w(f"\n- **{key}:** {val['from']} → {val['to']}")
 
     if diff.get("error_changes"):
-        lines.append("\n## Error Changes\n")
+        w("\n\n## Error Changes\n")
         for ec in diff["error_changes"]:
             if ec["type"] == "new_errors":
-                lines.append(f"- 🔴 **New errors:** {', '.join(ec['tools'])}")
+                w(f"\n- 🔴 **New errors:** {', '.join(ec['tools'])}")
             else:
-                lines.append(f"- 🟢 **Resolved:** {', '.join(ec['tools'])}")
+                w(f"\n- 🟢 **Resolved:** {', '.join(ec['tools'])}")
 
-    return "\n".join(lines)
+    for sc in diff.get("sequence_changes", []):
+        if "nlcs" in sc:
+            w("\n\n## Sequence Changes\n")
+            w(f"\n- **nLCS:** {sc['nlcs']} ({sc['lcs_length']} common calls)")
+            w(f"\n- **Inserted:** {sc['insertions']}, **Deleted:** {sc['deletions']}")
+            for op in sc["anomalies"]:
+                mark = "➕" if op["op"] == "insert" else "➖"
+                w(f"\n- {mark} #{op['index']} `{op['tool']}`")
+
+    return buf.getvalue()
 
 
 def find_recent_traces(traces_dir: str, n: int = 2) -> List[Path]:
     """Find the N most recent trace files."""
-    trace_path = Path(traces_dir)
-    if not trace_path.exists():
+    try:
+        # DirEntry.stat() reuses what scandir already fetched where the OS provides it
+        with os.scandir(traces_dir) as it:
+            entries = [
+                e for e in it
+                if e.name.startswith("session_") and e.name.endswith(".jsonl") and e.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
-    trace_files = list(trace_path.glob("session_*.jsonl"))
-    trace_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-    return trace_files[:n]
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return [Path(e.path) for e in entries[:n]]
 
 
 def main():
@@ -276,6 +529,8 @@ def main():
     parser.add_argument("--traces-dir", help="Directory containing traces")
     parser.add_argument("--last", type=int, default=2, help="Compare last N traces")
     parser.add_argument("--format", choices=["json", "text", "md"], default="text")
+    parser.add_argument("--deep-diff", action="store_true",
+                        help="Score sequence changes with an LCS (quadratic in trace length)")
     args = parser.parse_args()
 
     # Determine trace files
@@ -298,18 +553,14 @@ def main():
             sys.exit(1)
 
     # Load and analyze traces
-    events1 = load_trace(str(file1))
-    events2 = load_trace(str(file2))
-
-    trace1 = analyze_trace(events1)
-    trace2 = analyze_trace(events2)
+    trace1, trace2 = analyze_pair(str(file1), str(file2))
 
     # Compare
-    diff = compare_traces(trace1, trace2)
+    diff = compare_traces(trace1, trace2, deep=args.deep_diff)
 
     # Get session IDs for display
-    session1_id = events1[0].get("session_id", Path(file1).stem) if events1 else Path(file1).stem
-    session2_id = events2[0].get("session_id", Path(file2).stem) if events2 else Path(file2).stem
+    session1_id = trace1["session_id"] or Path(file1).stem
+    session2_id = trace2["session_id"] or Path(file2).stem
 
     # Output
     if args.format == "json":
@@ -6,30 +6,69 @@ Detects OS, Python command, shell, and other environment details to ensure
 100% compatibility across macOS, Windows, and Linux systems.
 
 Usage:
-    python env_detector.py [--save <path>] [--json]
+    python env_detector.py [--save <path>] [--json] [--refresh]
 """
 
 import json
 import os
-import subprocess
+import platform
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+# Probe results are cached here, keyed by the interpreter and platform
+ENV_CACHE_FILE = Path.home() / ".cache" / "ctx-monitor" / "env.json"
 
 
 class EnvironmentDetector:
     """Detect and configure environment for cross-platform compatibility."""
 
-    def __init__(self):
+    def __init__(self, refresh: bool = False):
         self.os_type = self._detect_os()
-        self.python_cmd = self._detect_python()
+        self.python_cmd = None if refresh else self._load_cached_python()
+        if self.python_cmd is None:
+            self.python_cmd = self._detect_python()
+            self._save_cached_python()
         self.shell = self._detect_shell()
         self.path_separator = ";" if self.os_type == "windows" else ":"
 
+    @staticmethod
+    def _cache_key() -> List[str]:
+        """Identify the environment the cached probe results belong to."""
+        # platform.platform() would shell out to `uname -p`; these fields come from os.uname()
+        return [
+            platform.system(),
+            platform.release(),
+            platform.machine(),
+            sys.executable,
+            ".".join(map(str, sys.version_info[:3])),
+            os.environ.get("PATH", "")
+        ]
+
+    def _load_cached_python(self) -> Optional[str]:
+        """Return the cached Python command if it was probed in this environment."""
+        try:
+            cached = json.loads(ENV_CACHE_FILE.read_text())
+            if cached.get("key") == self._cache_key():
+                return cached.get("python_cmd")
+        except (OSError, ValueError, AttributeError):
+            pass
+        return None
+
+    def _save_cached_python(self):
+        """Cache the probed Python command; failures only cost a re-probe next time."""
+        try:
+            ENV_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            ENV_CACHE_FILE.write_text(json.dumps({
+                "key": self._cache_key(),
+                "python_cmd": self.python_cmd
+            }))
+        except OSError:
+            pass
+
     def _detect_os(self) -> str:
         """Detect operating system type."""
-        import platform
         system = platform.system().lower()
         if system == "darwin":
             return "macos"
@@ -41,6 +80,7 @@ class EnvironmentDetector:
 
     def _detect_python(self) -> str:
         """Detect the correct Python command for this system."""
+        import subprocess  # Only needed on a cache miss
         candidates = ["python3", "python", "py"]
 
         for cmd in candidates:
@@ -70,7 +110,6 @@ class EnvironmentDetector:
 
     def get_env_info(self) -> Dict[str, str]:
         """Get complete environment information."""
-        import platform
         return {
             "os_type": self.os_type,
             "os_name": {"macos": "macOS", "windows": "Windows", "linux": "Linux"}.get(self.os_type, "Unknown"),
@@ -88,6 +127,7 @@ class EnvironmentDetector:
 
     def verify_python(self) -> tuple:
         """Verify Python is working correctly. Returns (success, message)."""
+        import subprocess
         try:
             result = subprocess.run(
                 [self.python_cmd, "--version"],
@@ -150,9 +190,10 @@ def main():
     parser = argparse.ArgumentParser(description="Detect environment for ctx-monitor")
     parser.add_argument("--save", help="Save config to specified path")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached probe results")
     args = parser.parse_args()
 
-    detector = EnvironmentDetector()
+    detector = EnvironmentDetector(refresh=args.refresh)
 
     if args.json:
         print(json.dumps(detector.get_env_info(), indent=2))
@@ -15,13 +15,15 @@ Actions:
 """
 
 import argparse
+import functools
 import json
 import os
 import shutil
 import sys
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 # Import environment detector
 try:
@@ -45,6 +47,21 @@ CLAUDE_HOME = Path.home() / ".claude"
 PLUGINS_CACHE = CLAUDE_HOME / "plugins" / "cache"
 INSTALLED_PLUGINS_FILE = CLAUDE_HOME / "plugins" / "installed_plugins.json"
 
+# Hook events a complete hooks.json configures
+EXPECTED_HOOK_EVENTS = frozenset({
+    "SessionStart", "SessionEnd", "PreToolUse", "PostToolUse",
+    "UserPromptSubmit", "SubagentStop", "Stop", "PreCompact", "Notification"
+})
+
+# Parent directories searched for .claude-plugin above this script (it sits in <root>/scripts)
+MAX_PLUGIN_ROOT_DEPTH = 6
+
+# orjson is a faster drop-in for reading the JSON configs; the stdlib parser is the fallback
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 
 class Colors:
     """ANSI color codes."""
@@ -59,28 +76,68 @@ class Colors:
 
     @classmethod
     def success(cls, text: str) -> str:
-        return f"{cls.GREEN}✓{cls.RESET} {text}"
+        return SUCCESS_PREFIX + text
 
     @classmethod
     def error(cls, text: str) -> str:
-        return f"{cls.RED}✗{cls.RESET} {text}"
+        return ERROR_PREFIX + text
 
     @classmethod
     def warning(cls, text: str) -> str:
-        return f"{cls.YELLOW}⚠{cls.RESET} {text}"
+        return WARNING_PREFIX + text
 
     @classmethod
     def info(cls, text: str) -> str:
-        return f"{cls.BLUE}ℹ{cls.RESET} {text}"
+        return INFO_PREFIX + text
 
     @classmethod
     def step(cls, text: str) -> str:
-        return f"{cls.CYAN}→{cls.RESET} {text}"
+        return STEP_PREFIX + text
+
+
+# No escape codes when output is piped or redirected
+if not (sys.stdout and sys.stdout.isatty()):
+    for _name in ("RESET", "RED", "GREEN", "YELLOW", "BLUE", "CYAN", "BOLD", "DIM"):
+        setattr(Colors, _name, "")
+
+# Status-line prefixes, built once rather than formatted for every message
+SUCCESS_PREFIX = f"{Colors.GREEN}✓{Colors.RESET} "
+ERROR_PREFIX = f"{Colors.RED}✗{Colors.RESET} "
+WARNING_PREFIX = f"{Colors.YELLOW}⚠{Colors.RESET} "
+INFO_PREFIX = f"{Colors.BLUE}ℹ{Colors.RESET} "
+STEP_PREFIX = f"{Colors.CYAN}→{Colors.RESET} "
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write data to a sibling temp file and rename it over path, so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
+@functools.lru_cache(maxsize=1)
+def _find_plugin_root(script_path: Path) -> Optional[Path]:
+    """Find the plugin root containing script_path, if it lives inside ctx-monitor."""
+    if "ctx-monitor" not in script_path.parts:
+        return None
+    for parent in islice(script_path.parents, MAX_PLUGIN_ROOT_DEPTH):
+        if (parent / ".claude-plugin").exists():
+            return parent
+    return None
 
 
 class InstallResult:
     """Result of an installation step."""
 
+    __slots__ = ("errors", "messages", "success", "warnings")
+
     def __init__(self):
         self.success = True
         self.messages: List[str] = []
@@ -88,17 +145,17 @@ class InstallResult:
         self.errors: List[str] = []
 
     def add_success(self, msg: str):
-        self.messages.append(Colors.success(msg))
+        self.messages.append(SUCCESS_PREFIX + msg)
 
     def add_warning(self, msg: str):
-        self.warnings.append(Colors.warning(msg))
+        self.warnings.append(WARNING_PREFIX + msg)
 
     def add_error(self, msg: str):
-        self.errors.append(Colors.error(msg))
+        self.errors.append(ERROR_PREFIX + msg)
         self.success = False
 
     def add_info(self, msg: str):
-        self.messages.append(Colors.info(msg))
+        self.messages.append(INFO_PREFIX + msg)
 
 
 class Installer:
@@ -114,16 +171,15 @@ class Installer:
         self.status_file = self.monitor_dir / ".installed"
         self.env_config_file = self.monitor_dir / "environment.json"
         self.env_detector = EnvironmentDetector()
+        # (mtime_ns, parsed data) of installed_plugins.json, shared by the doctor checks
+        self._installed_plugins_cache: Optional[Tuple[int, Dict[str, Any]]] = None
 
     def _find_plugin_dir(self) -> Optional[Path]:
         """Find the ctx-monitor plugin directory."""
         # Check if we're running from within the plugin
-        script_path = Path(__file__).resolve()
-        if "ctx-monitor" in str(script_path):
-            # Navigate up to plugin root
-            for parent in script_path.parents:
-                if (parent / ".claude-plugin").exists():
-                    return parent
+        plugin_root = _find_plugin_root(Path(__file__).resolve())
+        if plugin_root:
+            return plugin_root
 
         # Check common locations
         candidates = [
@@ -216,37 +272,52 @@ This file configures ctx-monitor behavior for this project.
 """
 
         try:
-            self.config_file.write_text(default_config)
+            _write_atomic(self.config_file, default_config.encode())
             result.add_success(f"Configuration created: {self.config_file.name}")
             return True
         except Exception as e:
             result.add_error(f"Failed to create configuration: {e}")
             return False
 
-    def validate_hooks(self, result: InstallResult) -> bool:
-        """Validate hooks configuration."""
+    def validate_hooks(self, result: InstallResult, quick: bool = False) -> bool:
+        """Validate hooks configuration.
+
+        With quick=True only the file's presence and opening brace are checked,
+        which is enough for a status check; install and repair do the full parse.
+        """
         if not self.plugin_dir:
             result.add_warning("Cannot validate hooks - plugin directory not found")
             return True  # Not a fatal error
 
         hooks_file = self.plugin_dir / "hooks" / "hooks.json"
 
+        if quick:
+            try:
+                with open(hooks_file, 'rb') as f:
+                    head = f.read(64)
+            except FileNotFoundError:
+                result.add_error(f"Hooks configuration not found: {hooks_file}")
+                return False
+            except OSError as e:
+                result.add_error(f"Failed to validate hooks: {e}")
+                return False
+            if not head.lstrip().startswith(b"{"):
+                result.add_error(f"Invalid hooks.json: {hooks_file}")
+                return False
+            result.add_success("Hooks configuration found")
+            return True
+
         if not hooks_file.exists():
             result.add_error(f"Hooks configuration not found: {hooks_file}")
             return False
 
         try:
-            with open(hooks_file) as f:
-                hooks_data = json.load(f)
+            with open(hooks_file, 'rb') as f:
+                hooks_data = json_loads(f.read())
 
             hooks_config = hooks_data.get("hooks", {})
-            expected_events = [
-                "SessionStart", "SessionEnd", "PreToolUse", "PostToolUse",
-                "UserPromptSubmit", "SubagentStop", "Stop", "PreCompact", "Notification"
-            ]
-
-            found_events = [e for e in expected_events if e in hooks_config]
-            result.add_success(f"Hooks validated: {len(found_events)}/{len(expected_events)} events configured")
+            found_events = EXPECTED_HOOK_EVENTS & hooks_config.keys()
+            result.add_success(f"Hooks validated: {len(found_events)}/{len(EXPECTED_HOOK_EVENTS)} events configured")
 
             return True
 
@@ -290,7 +361,7 @@ This file configures ctx-monitor behavior for this project.
                 "project_dir": str(self.project_dir)
             }
 
-            self.status_file.write_text(json.dumps(status, indent=2))
+            _write_atomic(self.status_file, json.dumps(status, indent=2).encode())
             result.add_success("Installation status recorded")
             return True
 
@@ -321,8 +392,8 @@ This file configures ctx-monitor behavior for this project.
         if not self.config_file.exists():
             result.add_warning("Configuration file missing")
 
-        # Validate hooks
-        self.validate_hooks(result)
+        # Validate hooks (presence only; the full parse is left to install/repair)
+        self.validate_hooks(result, quick=True)
 
         # Validate event logger
         self.validate_event_logger(result)
@@ -505,16 +576,30 @@ This file configures ctx-monitor behavior for this project.
 
         return result.success, result
 
+    def _load_installed_plugins(self) -> Optional[Dict[str, Any]]:
+        """Parse installed_plugins.json, reusing the last parse while the file is unchanged."""
+        try:
+            mtime = INSTALLED_PLUGINS_FILE.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        cached = self._installed_plugins_cache
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        with open(INSTALLED_PLUGINS_FILE, 'rb') as f:
+            data = json_loads(f.read())
+        self._installed_plugins_cache = (mtime, data)
+        return data
+
     def _find_orphaned_cache_refs(self) -> List[str]:
         """Find references to plugins whose cache doesn't exist."""
         orphaned = []
 
-        if not INSTALLED_PLUGINS_FILE.exists():
-            return orphaned
-
         try:
-            with open(INSTALLED_PLUGINS_FILE) as f:
-                data = json.load(f)
+            data = self._load_installed_plugins()
+            if data is None:
+                return orphaned
 
             plugins = data.get("plugins", {})
             for plugin_id, installs in plugins.items():
@@ -532,12 +617,10 @@ This file configures ctx-monitor behavior for this project.
 
     def _fix_orphaned_cache_refs(self, orphaned: List[str]) -> bool:
         """Remove orphaned plugin references from installed_plugins.json."""
-        if not INSTALLED_PLUGINS_FILE.exists():
-            return False
-
         try:
-            with open(INSTALLED_PLUGINS_FILE) as f:
-                data = json.load(f)
+            data = self._load_installed_plugins()
+            if data is None:
+                return False
 
             plugins = data.get("plugins", {})
             modified = False
@@ -548,6 +631,8 @@ This file configures ctx-monitor behavior for this project.
                     modified = True
 
             if modified:
+                # The cached dict was edited in place; drop it so a failed write can't leave it stale
+                self._installed_plugins_cache = None
                 with open(INSTALLED_PLUGINS_FILE, 'w') as f:
                     json.dump(data, f, indent=4)
                 return True
@@ -564,29 +649,49 @@ This file configures ctx-monitor behavior for this project.
         if not PLUGINS_CACHE.exists():
             return empty
 
-        for marketplace_dir in PLUGINS_CACHE.iterdir():
-            if not marketplace_dir.is_dir():
-                continue
+        # One scandir pass per level; is_dir() comes from the directory entry, not a stat
+        with os.scandir(PLUGINS_CACHE) as marketplaces:
+            marketplace_dirs = [entry.path for entry in marketplaces if entry.is_dir()]
 
+        for marketplace_dir in marketplace_dirs:
             # Check each plugin cache
-            for item in marketplace_dir.iterdir():
-                if item.is_dir():
+            with os.scandir(marketplace_dir) as items:
+                for item in items:
                     # Check if it's empty or only has .DS_Store
-                    contents = list(item.iterdir())
-                    real_contents = [c for c in contents if c.name != ".DS_Store"]
-                    if not real_contents:
-                        empty.append(item)
+                    if item.is_dir() and not self._has_real_content(item.path):
+                        empty.append(Path(item.path))
 
         return empty
 
+    @staticmethod
+    def _has_real_content(path: str) -> bool:
+        """Return True as soon as the directory holds anything besides .DS_Store."""
+        with os.scandir(path) as entries:
+            return any(entry.name != ".DS_Store" for entry in entries)
+
     def _find_broken_symlinks(self) -> List[Path]:
         """Find broken symbolic links in the project."""
         broken = []
 
-        if self.claude_dir.exists():
-            for item in self.claude_dir.rglob("*"):
-                if item.is_symlink() and not item.exists():
-                    broken.append(item)
+        if not self.claude_dir.exists():
+            return broken
+
+        # Walk with scandir so symlink checks come from the directory entry rather
+        # than a stat per path; traces/ only ever holds trace files, so skip it
+        skip_dir = str(self.traces_dir)
+        pending = [str(self.claude_dir)]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_symlink():
+                        if not os.path.exists(entry.path):
+                            broken.append(Path(entry.path))
+                    elif entry.is_dir(follow_symlinks=False) and entry.path != skip_dir:
+                        pending.append(entry.path)
 
         return broken
 
@@ -598,46 +703,47 @@ This file configures ctx-monitor behavior for this project.
             return fixed
 
         scripts_dir = self.plugin_dir / "hooks" / "scripts"
-        if scripts_dir.exists():
-            for script in scripts_dir.glob("*.sh"):
-                if not os.access(script, os.X_OK):
-                    try:
-                        os.chmod(script, 0o755)
+        if not scripts_dir.exists():
+            return fixed
+
+        # One directory read; the mode comes from the entry's cached stat, not an access() call
+        with os.scandir(scripts_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".sh"):
+                    continue
+                try:
+                    if not entry.stat().st_mode & 0o111:
+                        os.chmod(entry.path, 0o755)
                         fixed += 1
-                    except Exception:
-                        pass
+                except Exception:
+                    pass
 
         return fixed
 
 
 def print_result(result: InstallResult):
     """Print installation result."""
-    print()
-
-    for msg in result.messages:
-        print(f"  {msg}")
-
-    for warn in result.warnings:
-        print(f"  {warn}")
-
-    for err in result.errors:
-        print(f"  {err}")
-
-    print()
+    # Collected and written in one call rather than a print() per line
+    lines = [""]
+    lines.extend(f"  {msg}" for msg in result.messages)
+    lines.extend(f"  {warn}" for warn in result.warnings)
+    lines.extend(f"  {err}" for err in result.errors)
+    lines.append("")
 
     if result.success:
-        print(f"  {Colors.GREEN}{Colors.BOLD}Installation complete!{Colors.RESET}")
-        print()
-        print(f"  {Colors.info('Next steps:')}")
-        print(f"    1. Run {Colors.CYAN}/ctx-monitor:start{Colors.RESET} to begin monitoring")
-        print("    2. Perform some operations")
-        print(f"    3. Run {Colors.CYAN}/ctx-monitor:dashboard{Colors.RESET} to view metrics")
+        lines.append(f"  {Colors.GREEN}{Colors.BOLD}Installation complete!{Colors.RESET}")
+        lines.append("")
+        lines.append(f"  {Colors.info('Next steps:')}")
+        lines.append(f"    1. Run {Colors.CYAN}/ctx-monitor:start{Colors.RESET} to begin monitoring")
+        lines.append("    2. Perform some operations")
+        lines.append(f"    3. Run {Colors.CYAN}/ctx-monitor:dashboard{Colors.RESET} to view metrics")
     else:
-        print(f"  {Colors.RED}{Colors.BOLD}Installation failed!{Colors.RESET}")
-        print()
-        print(f"  {Colors.info('Please fix the errors above and try again.')}")
+        lines.append(f"  {Colors.RED}{Colors.BOLD}Installation failed!{Colors.RESET}")
+        lines.append("")
+        lines.append(f"  {Colors.info('Please fix the errors above and try again.')}")
 
-    print()
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -11,85 +11,132 @@ import sys
 import argparse
 from datetime import datetime
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, List, Any
-
-
-def load_trace(file_path: str) -> List[Dict[str, Any]]:
-    """Load events from a JSONL trace file."""
-    events = []
-    with open(file_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError as e:
-                    print(f"Warning: Skipping malformed line: {e}", file=sys.stderr)
-    return events
-
-
-def analyze_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Analyze events and generate statistics."""
-    if not events:
-        return {"error": "No events found"}
-
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, Iterator, Any
+
+# orjson parses trace lines several times faster; the stdlib parser is the fallback
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+TRACE_READ_SIZE = 1 << 20  # Bytes read per block when streaming a trace
+TOOL_EVENT_TYPES = frozenset({"PreToolUse", "PostToolUse"})
+
+
+def load_trace(file_path: str) -> Iterator[Dict[str, Any]]:
+    """Yield events from a JSONL trace file as they are parsed.
+
+    The file is read as bytes in large blocks and split on newlines, so
+    each line goes to the parser without a per-line decode or strip.
+    """
+    with open(file_path, 'rb') as f:
+        tail = b""
+        while True:
+            chunk = f.read(TRACE_READ_SIZE)
+            lines = (tail + chunk).split(b"\n")
+            # Keep the incomplete last line for the next block; at EOF parse everything
+            tail = lines.pop() if chunk else b""
+            for line in lines:
+                if line and not line.isspace():
+                    try:
+                        yield json_loads(line)
+                    except json.JSONDecodeError as e:
+                        print(f"Warning: Skipping malformed line: {e}", file=sys.stderr)
+            if not chunk:
+                break
+
+
+def analyze_events(events: Iterable[Dict[str, Any]], include_timeline: bool = False) -> Dict[str, Any]:
+    """Analyze events and generate statistics.
+
+    events is consumed in a single pass, so it can be the load_trace
+    generator rather than a list held in memory. The per-event timeline
+    is only built, and only returned, when include_timeline is set.
+    """
     # Basic stats
-    event_types = defaultdict(int)
+    event_types = Counter()
     tool_calls = defaultdict(lambda: {"count": 0, "errors": 0, "total_duration": 0})
     errors = []
     timeline = []
+    session_id = None
+    total_events = 0
+    # Only the first and last timestamps are needed for the session duration;
+    # last_ts stays None until a second timestamp is seen
+    first_ts = last_ts = None
 
     for event in events:
+        if not total_events:
+            session_id = event.get("session_id")
+        total_events += 1
+        timestamp = event.get("timestamp")
+        if timestamp:
+            if first_ts is None:
+                first_ts = timestamp
+            else:
+                last_ts = timestamp
+
         event_type = event.get("event_type", "unknown")
         event_types[event_type] += 1
+        status = event.get("status")
 
-        # Track tool calls
-        if event_type in ["PreToolUse", "PostToolUse"]:
+        # Track tool calls; the per-tool stats dict is looked up once per event
+        if event_type in TOOL_EVENT_TYPES:
             tool_name = event.get("tool_name", "unknown")
-            tool_calls[tool_name]["count"] += 1
+            stats = tool_calls[tool_name]
+            stats["count"] += 1
 
-            if event.get("status") == "error":
-                tool_calls[tool_name]["errors"] += 1
+            if status == "error":
+                stats["errors"] += 1
                 errors.append({
-                    "timestamp": event.get("timestamp"),
+                    "timestamp": timestamp,
                     "tool": tool_name,
                     "error": event.get("error_message", "Unknown error")
                 })
 
             if "duration_ms" in event:
-                tool_calls[tool_name]["total_duration"] += event["duration_ms"]
+                stats["total_duration"] += event["duration_ms"]
 
         # Build timeline
-        timeline.append({
-            "timestamp": event.get("timestamp"),
-            "type": event_type,
-            "tool": event.get("tool_name"),
-            "status": event.get("status")
-        })
+        if include_timeline:
+            timeline.append({
+                "timestamp": timestamp,
+                "type": event_type,
+                "tool": event.get("tool_name"),
+                "status": status
+            })
+
+    if not total_events:
+        return {"error": "No events found"}
 
     # Calculate session duration
-    timestamps = [e.get("timestamp") for e in events if e.get("timestamp")]
-    if len(timestamps) >= 2:
+    if last_ts is not None:
         try:
-            start = datetime.fromisoformat(timestamps[0].replace('Z', '+00:00'))
-            end = datetime.fromisoformat(timestamps[-1].replace('Z', '+00:00'))
+            start = datetime.fromisoformat(first_ts.replace('Z', '+00:00'))
+            end = datetime.fromisoformat(last_ts.replace('Z', '+00:00'))
             duration_seconds = (end - start).total_seconds()
         except (ValueError, TypeError):
             duration_seconds = None
     else:
         duration_seconds = None
 
-    return {
-        "session_id": events[0].get("session_id") if events else None,
-        "total_events": len(events),
+    analysis = {
+        "session_id": session_id,
+        "total_events": total_events,
         "event_types": dict(event_types),
         "tool_calls": dict(tool_calls),
         "errors": errors,
         "error_count": len(errors),
-        "duration_seconds": duration_seconds,
-        "timeline": timeline
+        "duration_seconds": duration_seconds
     }
+    if include_timeline:
+        analysis["timeline"] = timeline
+    return analysis
+
+
+def _error_rate(stats: Dict[str, Any]) -> float:
+    """Percentage of a tool's calls that errored."""
+    return (stats['errors'] / stats['count'] * 100) if stats['count'] > 0 else 0
 
 
 def format_text(analysis: Dict[str, Any]) -> str:
@@ -105,18 +152,20 @@ def format_text(analysis: Dict[str, Any]) -> str:
         lines.append(f"Duration: {analysis['duration_seconds']:.2f} seconds")
 
     lines.append("\nEvent Types:")
-    for event_type, count in analysis.get('event_types', {}).items():
-        lines.append(f"  - {event_type}: {count}")
+    lines.extend(f"  - {event_type}: {count}" for event_type, count in analysis.get('event_types', {}).items())
 
     lines.append("\nTool Calls:")
-    for tool, stats in analysis.get('tool_calls', {}).items():
-        error_rate = (stats['errors'] / stats['count'] * 100) if stats['count'] > 0 else 0
-        lines.append(f"  - {tool}: {stats['count']} calls ({error_rate:.1f}% errors)")
+    lines.extend(
+        f"  - {tool}: {stats['count']} calls ({_error_rate(stats):.1f}% errors)"
+        for tool, stats in analysis.get('tool_calls', {}).items()
+    )
 
     if analysis.get('errors'):
         lines.append(f"\nErrors ({analysis.get('error_count', 0)}):")
-        for error in analysis['errors'][:10]:  # Limit to 10
-            lines.append(f"  [{error.get('timestamp', '?')}] {error.get('tool', '?')}: {error.get('error', '?')}")
+        lines.extend(
+            f"  [{error.get('timestamp', '?')}] {error.get('tool', '?')}: {error.get('error', '?')}"
+            for error in analysis['errors'][:10]  # Limit to 10
+        )
 
     lines.append("\n" + "=" * 60)
     return "\n".join(lines)
@@ -135,20 +184,22 @@ def format_markdown(analysis: Dict[str, Any]) -> str:
     lines.append("## Event Types\n")
     lines.append("| Event Type | Count |")
     lines.append("|------------|-------|")
-    for event_type, count in analysis.get('event_types', {}).items():
-        lines.append(f"| {event_type} | {count} |")
+    lines.extend(f"| {event_type} | {count} |" for event_type, count in analysis.get('event_types', {}).items())
 
     lines.append("\n## Tool Calls\n")
     lines.append("| Tool | Calls | Errors | Error Rate |")
     lines.append("|------|-------|--------|------------|")
-    for tool, stats in analysis.get('tool_calls', {}).items():
-        error_rate = (stats['errors'] / stats['count'] * 100) if stats['count'] > 0 else 0
-        lines.append(f"| {tool} | {stats['count']} | {stats['errors']} | {error_rate:.1f}% |")
+    lines.extend(
+        f"| {tool} | {stats['count']} | {stats['errors']} | {_error_rate(stats):.1f}% |"
+        for tool, stats in analysis.get('tool_calls', {}).items()
+    )
 
     if analysis.get('errors'):
         lines.append(f"\n## Errors ({analysis.get('error_count', 0)})\n")
-        for error in analysis['errors'][:10]:
-            lines.append(f"- **{error.get('tool', '?')}** at `{error.get('timestamp', '?')}`: {error.get('error', '?')}")
+        lines.extend(
+            f"- **{error.get('tool', '?')}** at `{error.get('timestamp', '?')}`: {error.get('error', '?')}"
+            for error in analysis['errors'][:10]
+        )
 
     return "\n".join(lines)
 
@@ -165,7 +216,8 @@ def main():
         sys.exit(1)
 
     events = load_trace(args.file)
-    analysis = analyze_events(events)
+    # Only the full JSON output includes the timeline
+    analysis = analyze_events(events, include_timeline=args.format == "json" and not args.summary)
 
     if args.summary:
         # Minimal summary
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+test_diff_engine.py - Tests for diff-engine.py trace reading
+
+Usage:
+    python -m unittest discover plugins/ctx-monitor/tests
+"""
+
+import importlib.util
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# diff-engine.py has a hyphen in its name, so it is loaded by path
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "diff-engine.py"
+spec = importlib.util.spec_from_file_location("diff_engine", SCRIPT)
+diff_engine = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(diff_engine)
+
+TRACE = (
+    b'{"event_type": "PreToolUse", "session_id": "s1", "tool_name": "Read", "status": "success"}\n'
+    b'{"event_type": "PostToolUse", "session_id": "s1", "tool_name": "Bash", "status": "error"}\n'
+    b'\n'
+    b'{"event_type": "Stop", "session_id": "s1"}'
+)
+
+
+class IterTraceTest(unittest.TestCase):
+    """iter_trace must read regular files and pipes alike."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _regular(self, data: bytes) -> str:
+        path = os.path.join(self.tmp.name, "trace.jsonl")
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_regular_file(self):
+        events = list(diff_engine.iter_trace(self._regular(TRACE)))
+        self.assertEqual([e["event_type"] for e in events], ["PreToolUse", "PostToolUse", "Stop"])
+
+    def test_empty_file(self):
+        self.assertEqual(list(diff_engine.iter_trace(self._regular(b""))), [])
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "FIFOs not supported on this platform")
+    def test_fifo_matches_regular_file(self):
+        fifo = os.path.join(self.tmp.name, "trace.fifo")
+        os.mkfifo(fifo)
+
+        def feed():
+            with open(fifo, "wb") as f:
+                f.write(TRACE)
+
+        writer = threading.Thread(target=feed)
+        writer.start()
+        try:
+            from_fifo = list(diff_engine.iter_trace(fifo))
+        finally:
+            writer.join()
+
+        self.assertEqual(from_fifo, list(diff_engine.iter_trace(self._regular(TRACE))))
+
+    @unittest.skipUnless(os.path.isdir("/dev/fd"), "/dev/fd not available on this platform")
+    def test_pipe_analysis_matches_regular_file(self):
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(write_fd, "wb") as w:
+            w.write(TRACE)  # Fits in the pipe buffer, so no writer thread is needed
+        try:
+            from_pipe = diff_engine.analyze_file(f"/dev/fd/{read_fd}")
+        finally:
+            os.close(read_fd)
+
+        expected = diff_engine.analyze_file(self._regular(TRACE))
+        self.assertEqual(from_pipe["total_events"], 3)
+        self.assertEqual(from_pipe["call_counts"], expected["call_counts"])
+        self.assertEqual(from_pipe["error_counts"], expected["error_counts"])
+
+
+if __name__ == "__main__":
+    unittest.main()